@@ -5,8 +5,8 @@ from __future__ import annotations
 import asyncio
 import time
 import uuid
-from collections.abc import AsyncIterator
-from typing import Any
+from collections.abc import AsyncIterator, Callable
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
@@ -14,14 +14,16 @@ from agent.agents.remediation import RemediationAgent
 from agent.agents.research import ResearchAgent
 from agent.agents.triage import TriageAgent
 from agent.llm_client import LLMClient
-from agent.models import Alert, IncidentReport, StreamEvent
+from agent.models import AgentStep, Alert, IncidentReport, StreamEvent
 from monitoring.finops import CostTracker
 from monitoring.metrics import record_analysis_complete
 from monitoring.tracer import DecisionTracer
 from protocols.a2a import MessageBus, new_trace_id
-from rag.engine import RAGEngine
 from tools.registry import ToolRegistry
 
+if TYPE_CHECKING:
+    from rag.engine import RAGEngine
+
 # Module-level singleton so cost data persists across analyses
 _cost_tracker = CostTracker()
 
@@ -48,8 +50,17 @@ class IncidentAnalyzer:
         self._research = ResearchAgent(llm_client, self._tool_registry, self._tracer)
         self._remediation = RemediationAgent(llm_client, self._tool_registry, self._tracer)
 
-    async def analyze(self, alert: Alert) -> IncidentReport:
-        """Run the full analysis pipeline on an alert."""
+    async def analyze(
+        self,
+        alert: Alert,
+        on_step: Callable[[AgentStep], None] | None = None,
+    ) -> IncidentReport:
+        """Run the full analysis pipeline on an alert.
+
+        Args:
+            on_step: Optional callback invoked with each agent step as soon as it
+                is logged, so callers can show progress before the report is ready.
+        """
         incident_id = f"INC-{uuid.uuid4().hex[:8].upper()}"
         trace_id = new_trace_id()
         start_time = time.perf_counter()
@@ -63,6 +74,7 @@ class IncidentAnalyzer:
         )
 
         self._tracer.start_trace(trace_id)
+        self._tracer.watch(trace_id, on_step)
 
         triage_result: dict[str, Any] = {}
         research_result: dict[str, Any] = {}
@@ -94,6 +106,8 @@ class IncidentAnalyzer:
                 action="error",
                 reasoning=f"Analysis failed: {e}",
             )
+        finally:
+            self._tracer.watch(trace_id, None)
 
         duration = time.perf_counter() - start_time
         report = self._build_report(
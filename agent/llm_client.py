@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
 import anthropic
@@ -12,7 +15,7 @@ import structlog
 logger = structlog.get_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsage:
     """Token counts from an LLM response."""
 
@@ -25,7 +28,7 @@ class TokenUsage:
         return self.input_tokens + self.output_tokens
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Response:
     """Standardized LLM response."""
 
@@ -61,6 +64,11 @@ class AnthropicClient:
         self._model = model or os.environ.get("LLM_MODEL", "claude-sonnet-4-20250514")
         self._client = anthropic.AsyncAnthropic(api_key=self._api_key)
 
+    @property
+    def model(self) -> str:
+        """Model name sent with every request."""
+        return self._model
+
     async def chat(
         self,
         messages: list[dict[str, Any]],
@@ -83,7 +91,16 @@ class AnthropicClient:
             "messages": non_system,
         }
         if system_parts:
-            kwargs["system"] = "\n\n".join(system_parts)
+            # Each agent's system prompt and tool list are static, so mark the end
+            # of that prefix as cacheable; only the conversation after it varies
+            # between the turns of a tool-use loop.
+            kwargs["system"] = [
+                {
+                    "type": "text",
+                    "text": "\n\n".join(system_parts),
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
         if tools:
             kwargs["tools"] = tools
 
@@ -113,6 +130,7 @@ class AnthropicClient:
             model=self._model,
             input_tokens=usage.input_tokens,
             output_tokens=usage.output_tokens,
+            cache_read_input_tokens=getattr(api_response.usage, "cache_read_input_tokens", None),
         )
 
         return Response(
@@ -157,6 +175,68 @@ class MockClient:
         )
 
 
+# Only complete answers are cached; e.g. a max_tokens cut-off is not replayed
+_CACHEABLE_STOP_REASONS = frozenset({"end_turn", "tool_use", "stop_sequence"})
+
+
+class CachingClient:
+    """Wraps an LLM client with a disk-backed cache of its responses.
+
+    Requests are keyed by a hash of the model, messages and tools, so replaying
+    an identical conversation (e.g. re-running a fixed demo alert) is answered
+    from disk without an API call. ``model`` defaults to the inner client's
+    ``model`` attribute.
+    """
+
+    def __init__(
+        self,
+        inner: LLMClient,
+        cache_path: str | Path,
+        model: str | None = None,
+    ) -> None:
+        self._inner = inner
+        self._model = model if model is not None else getattr(inner, "model", None)
+        self._path = Path(cache_path).expanduser()
+        try:
+            self._entries: dict[str, dict[str, Any]] = json.loads(
+                self._path.read_text(encoding="utf-8")
+            )
+        except (FileNotFoundError, ValueError):
+            self._entries = {}
+
+    def _key(self, messages: list[dict[str, Any]], tools: list[dict[str, Any]] | None) -> str:
+        payload = json.dumps(
+            {"model": self._model, "messages": messages, "tools": tools},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    async def chat(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+    ) -> Response:
+        """Return the cached response for this request, or fetch and cache it."""
+        key = self._key(messages, tools)
+        cached = self._entries.get(key)
+        if cached is not None:
+            logger.info("llm_cache_hit", key=key)
+            return Response(
+                content=cached["content"],
+                tool_calls=cached["tool_calls"],
+                usage=TokenUsage(**cached["usage"]),
+                model=cached["model"],
+                stop_reason=cached["stop_reason"],
+            )
+
+        response = await self._inner.chat(messages, tools)
+        if response.stop_reason in _CACHEABLE_STOP_REASONS:
+            self._entries[key] = asdict(response)
+            self._path.write_text(json.dumps(self._entries), encoding="utf-8")
+        return response
+
+
 def create_client(provider: str | None = None) -> LLMClient:
     """Factory function to create the appropriate LLM client based on config."""
     provider = provider or os.environ.get("LLM_PROVIDER", "anthropic")
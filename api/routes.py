@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import json
+import os
 from collections.abc import AsyncIterator
 from typing import Any
 
 import structlog
 from fastapi import APIRouter, HTTPException, Query
-from prometheus_client import generate_latest
+from prometheus_client import CollectorRegistry, generate_latest, multiprocess
 from starlette.responses import Response as StarletteResponse
 from starlette.responses import StreamingResponse
 
@@ -198,8 +199,18 @@ async def health_check() -> dict[str, Any]:
 
 @metrics_router.get("/metrics")
 async def prometheus_metrics() -> StarletteResponse:
-    """Expose Prometheus metrics."""
+    """Expose Prometheus metrics.
+
+    With PROMETHEUS_MULTIPROC_DIR set (multi-worker servers), metrics are
+    aggregated from every worker's mmap files rather than just this process.
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+        content = generate_latest(registry)
+    else:
+        content = generate_latest()
     return StarletteResponse(
-        content=generate_latest(),
+        content=content,
         media_type="text/plain; version=0.0.4; charset=utf-8",
     )
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 
 import httpx
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -29,18 +30,36 @@ AGENT_ICONS = {
 }
 
 
+@st.cache_resource
+def _http_client() -> httpx.Client:
+    """Shared HTTP client so connections to the API are pooled across reruns."""
+    return httpx.Client(base_url=API_BASE, timeout=10)
+
+
 def _api_get(path: str, **kwargs) -> dict | list | None:
     try:
-        r = httpx.get(f"{API_BASE}{path}", timeout=30, **kwargs)
+        r = _http_client().get(path, timeout=30, **kwargs)
         r.raise_for_status()
         return r.json()
     except httpx.HTTPError:
         return None
 
 
+def _fetch_incidents(limit: int = 100) -> list[dict]:
+    """Fetch recent incidents with the fields used for analytics always present."""
+    incidents = _api_get(f"/api/v1/incidents?limit={limit}") or []
+    for inc in incidents:
+        inc.setdefault("severity", "unknown")
+        inc.setdefault("timestamp", "")
+        inc.setdefault("total_cost_usd", 0.0)
+        inc.setdefault("duration_seconds", 0.0)
+        inc.setdefault("requires_human_approval", False)
+    return incidents
+
+
 def _api_post(path: str, payload: dict, **kwargs) -> dict | None:
     try:
-        r = httpx.post(f"{API_BASE}{path}", json=payload, timeout=120, **kwargs)
+        r = _http_client().post(path, json=payload, timeout=120, **kwargs)
         r.raise_for_status()
         return r.json()
     except httpx.HTTPError as e:
@@ -54,7 +73,7 @@ def _api_post_stream(path: str, payload: dict) -> dict | None:
 
     report = None
     try:
-        with httpx.stream("POST", f"{API_BASE}{path}", json=payload, timeout=180) as resp:
+        with _http_client().stream("POST", path, json=payload, timeout=180) as resp:
             resp.raise_for_status()
             status = st.status("Running analysis pipeline...", expanded=True)
             for line in resp.iter_lines():
@@ -100,10 +119,31 @@ def _confidence_color(score: float) -> str:
     return "red"
 
 
+@st.cache_data
+def _parse_timestamps(timestamps: tuple[str, ...]) -> np.ndarray:
+    """Parse ISO timestamps into a UTC datetime64 array (NaT where unparseable)."""
+    parsed: list[datetime | None] = []
+    for ts in timestamps:
+        try:
+            dt = datetime.fromisoformat(ts)
+        except ValueError:
+            parsed.append(None)
+            continue
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(UTC).replace(tzinfo=None)
+        parsed.append(dt)
+    return np.array(parsed, dtype="datetime64[ns]")
+
+
+@st.cache_data(max_entries=4)
 def _parse_prometheus_metrics(text: str) -> dict[str, list[tuple[dict, float]]]:
     """Parse Prometheus text exposition format into {metric_name: [(labels, value)]}."""
     metrics: dict[str, list[tuple[dict, float]]] = {}
-    for line in text.strip().split("\n"):
+    lines = text.strip().split("\n")
+    # Fast path: exposition with only HELP/TYPE comments has no samples to parse
+    if all(line.startswith("#") for line in lines):
+        return metrics
+    for line in lines:
         if line.startswith("#") or not line.strip():
             continue
         # e.g. sentinel_tool_calls_total{tool_name="get_metrics"} 4.0
@@ -423,10 +463,10 @@ with tab_analytics:
     st.subheader("System Analytics")
 
     # Fetch all data
-    all_incidents = _api_get("/api/v1/incidents?limit=100") or []
+    all_incidents = _fetch_incidents()
     prom_text = None
     try:
-        r = httpx.get(f"{API_BASE}/metrics", timeout=10)
+        r = _http_client().get("/metrics")
         if r.status_code == 200:
             prom_text = r.text
     except httpx.HTTPError:
@@ -445,18 +485,18 @@ with tab_analytics:
 
         with m2:
             if all_incidents:
-                total = sum(i.get("total_cost_usd", 0) for i in all_incidents)
+                total = sum(i["total_cost_usd"] for i in all_incidents)
                 avg_cost = total / len(all_incidents)
                 st.metric("Avg Cost / Analysis", f"${avg_cost:.4f}")
             else:
                 st.metric("Avg Cost / Analysis", "$0.00")
 
         with m3:
-            total_cost_all = sum(i.get("total_cost_usd", 0) for i in all_incidents)
+            total_cost_all = sum(i["total_cost_usd"] for i in all_incidents)
             st.metric("Total Cost", f"${total_cost_all:.4f}")
 
         with m4:
-            approval_count = sum(1 for i in all_incidents if i.get("requires_human_approval"))
+            approval_count = sum(1 for i in all_incidents if i["requires_human_approval"])
             rate = (approval_count / len(all_incidents) * 100) if all_incidents else 0
             st.metric("Approval Rate", f"{rate:.0f}%")
 
@@ -469,23 +509,17 @@ with tab_analytics:
         with chart_left:
             st.markdown("**Cost Per Analysis Over Time**")
             if all_incidents:
-                cost_df = pd.DataFrame([
-                    {
-                        "timestamp": i.get("timestamp", ""),
-                        "cost_usd": i.get("total_cost_usd", 0),
-                    }
-                    for i in reversed(all_incidents)
-                ])
-                if not cost_df.empty and "timestamp" in cost_df.columns:
-                    cost_df["timestamp"] = pd.to_datetime(cost_df["timestamp"], errors="coerce")
-                    cost_df = cost_df.dropna(subset=["timestamp"])
-                    if not cost_df.empty:
-                        cost_df = cost_df.set_index("timestamp")
-                        st.line_chart(cost_df["cost_usd"])
-                    else:
-                        st.caption("No timestamp data available.")
+                oldest_first = all_incidents[::-1]
+                timestamps = _parse_timestamps(tuple(i["timestamp"] for i in oldest_first))
+                cost_series = pd.Series(
+                    [i["total_cost_usd"] for i in oldest_first],
+                    index=timestamps,
+                    name="cost_usd",
+                )[~np.isnat(timestamps)]
+                if not cost_series.empty:
+                    st.line_chart(cost_series)
                 else:
-                    st.caption("No cost data available.")
+                    st.caption("No timestamp data available.")
             else:
                 st.caption("No data yet.")
 
@@ -495,7 +529,7 @@ with tab_analytics:
             if all_incidents:
                 sev_counts: dict[str, int] = {}
                 for i in all_incidents:
-                    s = i.get("severity", "unknown")
+                    s = i["severity"]
                     sev_counts[s] = sev_counts.get(s, 0) + 1
                 sev_df = pd.DataFrame(
                     list(sev_counts.items()),
@@ -564,26 +598,30 @@ with tab_analytics:
             st.markdown("**Token Usage by Agent**")
             token_data = prom.get("sentinel_llm_tokens_total", [])
             if token_data:
-                agent_tokens: dict[str, dict[str, float]] = {}
-                for lbl, val in token_data:
-                    agent = lbl.get("agent_name", "?")
-                    direction = lbl.get("direction", "?")
-                    if agent not in agent_tokens:
-                        agent_tokens[agent] = {}
-                    agent_tokens[agent][direction] = val
-                if agent_tokens:
-                    token_df = pd.DataFrame(agent_tokens).T.fillna(0)
-                    st.bar_chart(token_df)
-                else:
-                    st.caption("No token data yet.")
+                token_df = pd.DataFrame({
+                    "agent": [lbl.get("agent_name", "?") for lbl, _ in token_data],
+                    "direction": [lbl.get("direction", "?") for lbl, _ in token_data],
+                    "tokens": [val for _, val in token_data],
+                }).pivot_table(
+                    index="agent",
+                    columns="direction",
+                    values="tokens",
+                    aggfunc="last",
+                    fill_value=0,
+                )
+                st.bar_chart(token_df)
             else:
                 st.caption("No token data yet.")
 
         with chart_right3:
             st.markdown("**Analysis Duration Distribution**")
             if all_incidents:
-                durations = [i.get("duration_seconds", 0) for i in all_incidents]
-                dur_df = pd.DataFrame(durations, columns=["Duration (s)"])
-                st.bar_chart(dur_df.value_counts(bins=10).sort_index())
+                durations = [i["duration_seconds"] for i in all_incidents]
+                counts, edges = np.histogram(np.asarray(durations, dtype=np.float64), bins=10)
+                dur_df = pd.DataFrame(
+                    {"count": counts},
+                    index=[f"{edges[i]:.1f}-{edges[i + 1]:.1f}" for i in range(len(counts))],
+                )
+                st.bar_chart(dur_df)
             else:
                 st.caption("No data yet.")
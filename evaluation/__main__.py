@@ -12,9 +12,12 @@ from evaluation.runner import run_all
 
 def main() -> None:
     mode = os.environ.get("EVAL_MODE", "mock")
+    # Optional comma-separated subset, e.g. EVAL_SCENARIOS=memory_leak,cpu_spike
+    selected = os.environ.get("EVAL_SCENARIOS")
+    names = [n.strip() for n in selected.split(",") if n.strip()] if selected else None
     print(f"Running Sentinel evaluation suite in {mode.upper()} mode...")
 
-    run = asyncio.run(run_all(mode=mode))
+    run = asyncio.run(run_all(mode=mode, names=names))
 
     # Print summary
     print(f"\nResults: {len(run.results)} scenarios")
@@ -0,0 +1,94 @@
+"""Multi-keyword substring matching used by the evaluation scorer."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+# Optional backends, bound to Any so either can be None when not installed
+_ahocorasick_rs: Any
+_pyahocorasick: Any
+
+try:
+    import ahocorasick_rs
+except ImportError:  # optional: pip install "sentinel[eval]"
+    _ahocorasick_rs = None
+else:
+    _ahocorasick_rs = ahocorasick_rs
+
+try:
+    import ahocorasick
+except ImportError:  # optional fallback when ahocorasick_rs is unavailable
+    _pyahocorasick = None
+else:
+    _pyahocorasick = ahocorasick
+
+
+class KeywordMatcher:
+    """Finds which of a fixed set of lowercased keywords occur in a text.
+
+    With ahocorasick_rs (or, failing that, pyahocorasick) installed the keywords
+    are compiled into an automaton once, and each text is matched in a single
+    pass. Without either, each keyword is checked with a substring scan, after
+    a length/character-set prefilter.
+    """
+
+    def __init__(self, keywords_lc: Sequence[str]) -> None:
+        self.keywords: tuple[str, ...] = tuple(keywords_lc)
+        self._keyword_chars = tuple(frozenset(kw) for kw in self.keywords)
+        # With no duplicate keywords, the hit count is just len(found(...))
+        self._distinct = len(set(self.keywords)) == len(self.keywords)
+        self._automaton: Any = None
+        self._rust = False
+        if not self.keywords:
+            return
+        if _ahocorasick_rs is not None:
+            # Standard match kind is required to report overlapping matches
+            self._automaton = _ahocorasick_rs.AhoCorasick(
+                self.keywords, matchkind=_ahocorasick_rs.MatchKind.Standard
+            )
+            self._rust = True
+        elif _pyahocorasick is not None:
+            automaton = _pyahocorasick.Automaton()
+            for kw in self.keywords:
+                automaton.add_word(kw, kw)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def __reduce__(self) -> tuple[type[KeywordMatcher], tuple[tuple[str, ...]]]:
+        # The Rust automaton is not picklable; rebuild it from the keywords instead
+        return (KeywordMatcher, (self.keywords,))
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def found(self, text_lc: str) -> set[str]:
+        """Return the keywords that occur in the already-lowercased text."""
+        if self._automaton is not None:
+            if self._rust:
+                keywords = self.keywords
+                return {
+                    keywords[i]
+                    for i, _, _ in self._automaton.find_matches_as_indexes(
+                        text_lc, overlapping=True
+                    )
+                }
+            return {kw for _, kw in self._automaton.iter(text_lc)}
+        # Cheap prefilter: a keyword longer than the text, or using a character
+        # the text lacks, cannot match, so skip its substring scan entirely.
+        text_len = len(text_lc)
+        text_chars = set(text_lc)
+        return {
+            kw
+            for kw, chars in zip(self.keywords, self._keyword_chars)
+            if len(kw) <= text_len and chars <= text_chars and kw in text_lc
+        }
+
+    def overlap(self, text_lc: str) -> float:
+        """Fraction of keywords found in the text (1.0 if there are no keywords)."""
+        if not self.keywords:
+            return 1.0
+        hits = self.found(text_lc)
+        if self._distinct:
+            return len(hits) / len(self.keywords)
+        return sum(1 for kw in self.keywords if kw in hits) / len(self.keywords)
@@ -5,7 +5,19 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from pathlib import Path
 
-from evaluation.runner import EvalRun
+from evaluation.runner import EvalRun, ScenarioResult
+
+
+def _format_score_row(result: ScenarioResult) -> str:
+    """Format one scenario's score breakdown as a markdown table row."""
+    s = result.score
+    status = "PASS" if s.passed else "FAIL"
+    return (
+        f"| {s.scenario_name} | {s.root_cause_match:.0%} | "
+        f"{s.remediation_coverage:.0%} | {s.confidence_calibration:.0%} | "
+        f"{s.affected_services_accuracy:.0%} | **{s.total_score:.0%}** | "
+        f"{status} |"
+    )
 
 
 def generate_report(run: EvalRun, output_dir: str = "evaluation/results") -> str:
@@ -42,17 +54,7 @@ def generate_report(run: EvalRun, output_dir: str = "evaluation/results") -> str
         "**Total** | Pass |"
     )
     lines.append("|----------|-----------|-------------|------------|----------|-------|------|")
-
-    for r in run.results:
-        s = r.score
-        status = "PASS" if s.passed else "FAIL"
-        lines.append(
-            f"| {s.scenario_name} | {s.root_cause_match:.0%} | "
-            f"{s.remediation_coverage:.0%} | {s.confidence_calibration:.0%} | "
-            f"{s.affected_services_accuracy:.0%} | **{s.total_score:.0%}** | "
-            f"{status} |"
-        )
-
+    lines.extend(map(_format_score_row, run.results))
     lines.append("")
 
     # Errors
@@ -60,8 +62,7 @@ def generate_report(run: EvalRun, output_dir: str = "evaluation/results") -> str
     if errors:
         lines.append("## Errors")
         lines.append("")
-        for r in errors:
-            lines.append(f"- **{r.scenario.name}**: {r.error}")
+        lines.extend(f"- **{r.scenario.name}**: {r.error}" for r in errors)
         lines.append("")
 
     content = "\n".join(lines) + "\n"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from agent.core import IncidentAnalyzer
@@ -92,9 +93,9 @@ async def run_scenario(scenario: EvalScenario, mode: str) -> ScenarioResult:
     )
 
 
-async def run_all(mode: str = "mock") -> EvalRun:
-    """Run all registered scenarios and return aggregate results."""
-    scenarios = load_all_scenarios()
+async def run_all(mode: str = "mock", names: Sequence[str] | None = None) -> EvalRun:
+    """Run the named scenarios (default: all registered) and return aggregate results."""
+    scenarios = load_all_scenarios(names)
     start = time.perf_counter()
 
     results: list[ScenarioResult] = []
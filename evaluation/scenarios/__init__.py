@@ -2,32 +2,54 @@
 
 from __future__ import annotations
 
-from evaluation.scenarios._base import EvalScenario
-from evaluation.scenarios.certificate_expiry import scenario as _certificate_expiry
-from evaluation.scenarios.cpu_spike import scenario as _cpu_spike
-from evaluation.scenarios.database_replication_lag import scenario as _db_replication_lag
-from evaluation.scenarios.deployment_failure import scenario as _deployment_failure
-from evaluation.scenarios.disk_space_exhaustion import scenario as _disk_space
-from evaluation.scenarios.dns_resolution_failure import scenario as _dns_failure
-from evaluation.scenarios.kafka_consumer_lag import scenario as _kafka_lag
-from evaluation.scenarios.memory_leak import scenario as _memory_leak
-from evaluation.scenarios.payment_api_pool_exhaustion import scenario as _pool_exhaustion
-from evaluation.scenarios.rate_limiting import scenario as _rate_limiting
-
-ALL_SCENARIOS: list[EvalScenario] = [
-    _pool_exhaustion,
-    _memory_leak,
-    _deployment_failure,
-    _certificate_expiry,
-    _dns_failure,
-    _kafka_lag,
-    _disk_space,
-    _cpu_spike,
-    _rate_limiting,
-    _db_replication_lag,
-]
-
-
-def load_all_scenarios() -> list[EvalScenario]:
-    """Return every registered evaluation scenario."""
-    return list(ALL_SCENARIOS)
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
+
+from agent.models import Alert
+from evaluation.scenarios._base import EvalScenario, mock_response
+from evaluation.scenarios._data import SCENARIOS_DATA
+
+
+def _make_scenario(data: dict[str, Any]) -> EvalScenario:
+    """Build an EvalScenario from one SCENARIOS_DATA entry."""
+    return EvalScenario(
+        name=data["name"],
+        alert=Alert(**data["alert"]),
+        expected_root_cause_keywords=data["expected_root_cause_keywords"],
+        expected_remediation_keywords=data["expected_remediation_keywords"],
+        expected_affected_services=data["expected_affected_services"],
+        min_confidence=data["min_confidence"],
+        mock_responses=tuple(
+            mock_response(r["payload"], r["input_tokens"], r["output_tokens"])
+            for r in data["responses"]
+        ),
+    )
+
+
+_DATA_BY_NAME: dict[str, dict[str, Any]] = {d["name"]: d for d in SCENARIOS_DATA}
+
+SCENARIO_NAMES: tuple[str, ...] = tuple(_DATA_BY_NAME)
+
+
+@cache
+def get_scenario(name: str) -> EvalScenario:
+    """Build (once) and return the scenario registered under ``name``.
+
+    Raises KeyError for unknown names.
+    """
+    return _make_scenario(_DATA_BY_NAME[name])
+
+
+def load_all_scenarios(names: Iterable[str] | None = None) -> list[EvalScenario]:
+    """Return the named scenarios, or every registered scenario in registry order."""
+    return [get_scenario(name) for name in (SCENARIO_NAMES if names is None else names)]
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: build the full registry only when a caller asks for it
+    if name == "SCENARIOS":
+        return {scenario.name: scenario for scenario in load_all_scenarios()}
+    if name == "ALL_SCENARIOS":
+        return load_all_scenarios()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,20 +2,84 @@
 
 from __future__ import annotations
 
+import re
+import sys
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from typing import Any
 
-from agent.llm_client import Response
+import orjson
+
+from agent.llm_client import Response, TokenUsage
 from agent.models import Alert
+from evaluation.matching import KeywordMatcher
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EvalScenario:
     """A single evaluation scenario with expected outputs and optional mock responses."""
 
     name: str
     alert: Alert
-    expected_root_cause_keywords: list[str]
-    expected_remediation_keywords: list[str]
-    expected_affected_services: list[str]
+    expected_root_cause_keywords: Sequence[str]
+    expected_remediation_keywords: Sequence[str]
+    expected_affected_services: Sequence[str]
     min_confidence: float = 0.5
-    mock_responses: list[Response] = field(default_factory=list)
+    mock_responses: Sequence[Response] = ()
+
+    # Lowercased copies of the expectations, computed once for the scorer
+    root_cause_keywords_lc: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    remediation_keywords_lc: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    affected_services_lc: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    affected_services_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    root_cause_matcher: KeywordMatcher = field(init=False, repr=False, compare=False)
+    remediation_matcher: KeywordMatcher = field(init=False, repr=False, compare=False)
+    services_pattern: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: normalize to tuples and fill derived fields via object.__setattr__
+        set_ = object.__setattr__
+        set_(self, "expected_root_cause_keywords", tuple(self.expected_root_cause_keywords))
+        set_(self, "expected_remediation_keywords", tuple(self.expected_remediation_keywords))
+        set_(self, "expected_affected_services", tuple(self.expected_affected_services))
+        set_(self, "mock_responses", tuple(self.mock_responses))
+
+        root_cause_lc = tuple(sys.intern(k.lower()) for k in self.expected_root_cause_keywords)
+        remediation_lc = tuple(
+            sys.intern(k.lower()) for k in self.expected_remediation_keywords
+        )
+        services_lc = tuple(sys.intern(s.lower()) for s in self.expected_affected_services)
+        set_(self, "root_cause_keywords_lc", root_cause_lc)
+        set_(self, "remediation_keywords_lc", remediation_lc)
+        set_(self, "affected_services_lc", services_lc)
+        set_(self, "affected_services_set", frozenset(services_lc))
+        set_(self, "root_cause_matcher", KeywordMatcher(root_cause_lc))
+        set_(self, "remediation_matcher", KeywordMatcher(remediation_lc))
+        set_(self, "services_pattern", _alternation(services_lc))
+
+
+def _alternation(words: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile a pattern capturing the longest word starting at every text position.
+
+    The lookahead lets matches overlap; longest-first ordering means a shorter
+    word is only hidden when it is a prefix of a longer word that matched.
+    """
+    if not words:
+        return None
+    ordered = sorted(set(words), key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+
+
+def _dumps(payload: dict[str, Any]) -> str:
+    """Encode a payload as compact JSON."""
+    return orjson.dumps(payload).decode()
+
+
+def mock_response(payload: dict[str, Any], input_tokens: int, output_tokens: int) -> Response:
+    """Build a scripted end_turn Response whose content is the payload as compact JSON."""
+    return Response(
+        content=_dumps(payload),
+        usage=TokenUsage(input_tokens=input_tokens, output_tokens=output_tokens),
+        model="mock",
+        stop_reason="end_turn",
+    )
@@ -0,0 +1,757 @@
+"""Evaluation scenario definitions — alert, expected outputs, and scripted LLM payloads.
+
+Each entry is turned into an EvalScenario by evaluation.scenarios. Responses are
+listed in pipeline order: triage, research, remediation.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+SCENARIOS_DATA: tuple[dict[str, Any], ...] = (
+    # Payment API connection pool exhaustion.
+    {
+        "name": "payment_api_pool_exhaustion",
+        "alert": {
+            "service": "payment-api",
+            "description": "P99 latency spike to 2100ms, normal baseline 180ms",
+            "severity": "critical",
+            "timestamp": datetime(2024, 1, 15, 14, 30, 0, tzinfo=UTC),
+            "metadata": {"current_p99_ms": 2100},
+        },
+        "expected_root_cause_keywords": (
+            "connection pool", "exhaustion", "deployment", "database", "timeout",
+        ),
+        "expected_remediation_keywords": (
+            "rollback", "pool", "monitor", "deployment",
+        ),
+        "expected_affected_services": ("payment-api", "order-service"),
+        "min_confidence": 0.7,
+        "responses": (
+            {
+                "payload": {
+                    "classification": "resource-exhaustion",
+                    "affected_services": ["payment-api", "order-service"],
+                    "priority": "P1",
+                    "summary": (
+                        "Payment-api experiencing connection pool"
+                        " exhaustion causing cascading latency."
+                    ),
+                    "delegation_instructions": "Check payment-api ERROR logs for DB timeouts.",
+                },
+                "input_tokens": 500,
+                "output_tokens": 200,
+            },
+            {
+                "payload": {
+                    "timeline": [
+                        {
+                            "timestamp": "2024-01-15T14:00:00Z",
+                            "event": "Deployment a1bf3d2 applied",
+                        },
+                        {"timestamp": "2024-01-15T14:25:00Z", "event": "First DB timeout errors"},
+                    ],
+                    "root_cause": (
+                        "Deployment a1bf3d2 changed DB connection"
+                        " pool settings, causing pool exhaustion."
+                    ),
+                    "confidence": 0.92,
+                    "evidence": ["DB connection pool at 98% capacity"],
+                    "affected_services": ["payment-api", "order-service"],
+                },
+                "input_tokens": 2000,
+                "output_tokens": 500,
+            },
+            {
+                "payload": {
+                    "remediation_steps": [
+                        {
+                            "step": 1,
+                            "action": "Rollback deployment a1bf3d2",
+                            "risk": "high",
+                            "requires_approval": True,
+                        },
+                        {
+                            "step": 2,
+                            "action": "Monitor connection pool metrics",
+                            "risk": "low",
+                            "requires_approval": False,
+                        },
+                    ],
+                    "requires_human_approval": True,
+                    "summary": "Rollback the problematic deployment and monitor for recovery.",
+                },
+                "input_tokens": 1000,
+                "output_tokens": 300,
+            },
+        ),
+    },
+    # Memory leak in user-service.
+    {
+        "name": "memory_leak",
+        "alert": {
+            "service": "user-service",
+            "description": "Memory usage growing linearly, OOM kills every 6 hours",
+            "severity": "high",
+            "timestamp": datetime(2024, 2, 10, 8, 0, 0, tzinfo=UTC),
+            "metadata": {"heap_usage_mb": 1800, "oom_count_24h": 4},
+        },
+        "expected_root_cause_keywords": (
+            "memory", "leak", "cache", "garbage collection", "heap",
+        ),
+        "expected_remediation_keywords": (
+            "restart", "memory limit", "profiler", "cache eviction",
+        ),
+        "expected_affected_services": ("user-service",),
+        "min_confidence": 0.6,
+        "responses": (
+            {
+                "payload": {
+                    "classification": "resource-exhaustion",
+                    "affected_services": ["user-service"],
+                    "priority": "P2",
+                    "summary": (
+                        "user-service experiencing gradual"
+                        " memory leak leading to OOM kills."
+                    ),
+                    "delegation_instructions": "Check heap dumps and recent code changes.",
+                },
+                "input_tokens": 400,
+                "output_tokens": 180,
+            },
+            {
+                "payload": {
+                    "root_cause": (
+                        "Unbounded in-memory cache in user-service"
+                        " growing without eviction policy,"
+                        " causing OOM."
+                    ),
+                    "confidence": 0.78,
+                    "evidence": ["Heap grows 50MB/hour", "No cache TTL configured"],
+                    "affected_services": ["user-service"],
+                },
+                "input_tokens": 1500,
+                "output_tokens": 400,
+            },
+            {
+                "payload": {
+                    "remediation_steps": [
+                        {
+                            "step": 1,
+                            "action": "Add cache eviction with TTL of 15 minutes",
+                            "risk": "medium",
+                            "requires_approval": True,
+                        },
+                        {
+                            "step": 2,
+                            "action": "Restart user-service pods to reclaim memory",
+                            "risk": "low",
+                            "requires_approval": False,
+                        },
+                    ],
+                    "requires_human_approval": True,
+                    "summary": "Add cache eviction and restart to reclaim memory.",
+                },
+                "input_tokens": 800,
+                "output_tokens": 250,
+            },
+        ),
+    },
+    # Failed deployment causing 5xx errors.
+    {
+        "name": "deployment_failure",
+        "alert": {
+            "service": "checkout-service",
+            "description": "HTTP 500 rate jumped from 0.1% to 15% after deployment",
+            "severity": "critical",
+            "timestamp": datetime(2024, 3, 5, 16, 45, 0, tzinfo=UTC),
+            "metadata": {"error_rate_pct": 15.0, "last_deploy": "abc123"},
+        },
+        "expected_root_cause_keywords": (
+            "deployment", "error", "500", "regression", "config",
+        ),
+        "expected_remediation_keywords": (
+            "rollback", "deploy", "canary", "revert",
+        ),
+        "expected_affected_services": ("checkout-service",),
+        "min_confidence": 0.8,
+        "responses": (
+            {
+                "payload": {
+                    "classification": "deployment-regression",
+                    "affected_services": ["checkout-service"],
+                    "priority": "P1",
+                    "summary": "checkout-service error rate spiked after deployment abc123.",
+                    "delegation_instructions": "Check deployment diff and error logs.",
+                },
+                "input_tokens": 450,
+                "output_tokens": 190,
+            },
+            {
+                "payload": {
+                    "root_cause": (
+                        "Deployment abc123 introduced a null pointer"
+                        " in payment validation, causing 500"
+                        " errors on checkout."
+                    ),
+                    "confidence": 0.95,
+                    "evidence": [
+                        "Error rate correlated with deploy time",
+                        "NullPointerException in logs",
+                    ],
+                    "affected_services": ["checkout-service"],
+                },
+                "input_tokens": 1800,
+                "output_tokens": 450,
+            },
+            {
+                "payload": {
+                    "remediation_steps": [
+                        {
+                            "step": 1,
+                            "action": "Rollback deployment abc123 immediately",
+                            "risk": "low",
+                            "requires_approval": True,
+                        },
+                        {
+                            "step": 2,
+                            "action": "Fix null pointer bug and redeploy with canary",
+                            "risk": "medium",
+                            "requires_approval": True,
+                        },
+                    ],
+                    "requires_human_approval": True,
+                    "summary": "Rollback the bad deployment, then fix and redeploy safely.",
+                },
+                "input_tokens": 900,
+                "output_tokens": 280,
+            },
+        ),
+    },
+    # TLS certificate expiry causing connection failures.
+    {
+        "name": "certificate_expiry",
+        "alert": {
+            "service": "api-gateway",
+            "description": "SSL handshake failures increasing, certificate expires in 2 hours",
+            "severity": "critical",
+            "timestamp": datetime(2024, 4, 1, 22, 0, 0, tzinfo=UTC),
+            "metadata": {"cert_expiry": "2024-04-02T00:00:00Z", "handshake_failures_per_min": 150},
+        },
+        "expected_root_cause_keywords": (
+            "certificate", "expiry", "TLS", "SSL", "renewal",
+        ),
+        "expected_remediation_keywords": (
+            "renew", "certificate", "auto-renewal", "certbot",
+        ),
+        "expected_affected_services": ("api-gateway",),
+        "min_confidence": 0.9,
+        "responses": (
+            {
+                "payload": {
+                    "classification": "certificate-expiry",
+                    "affected_services": ["api-gateway"],
+                    "priority": "P1",
+                    "summary": (
+                        "api-gateway TLS certificate expiring"
+                        " imminently causing SSL handshake"
+                        " failures."
+                    ),
+                    "delegation_instructions": "Verify certificate expiry and renewal status.",
+                },
+                "input_tokens": 380,
+                "output_tokens": 170,
+            },
+            {
+                "payload": {
+                    "root_cause": (
+                        "TLS certificate for api-gateway expired,"
+                        " auto-renewal failed due to DNS challenge"
+                        " misconfiguration."
+                    ),
+                    "confidence": 0.97,
+                    "evidence": [
+                        "Certificate expiry matches failure onset",
+                        "Certbot logs show DNS challenge error",
+                    ],
+                    "affected_services": ["api-gateway"],
+                },
+                "input_tokens": 1200,
+                "output_tokens": 350,
+            },
+            {
+                "payload": {
+                    "remediation_steps": [
+                        {
+                            "step": 1,
+                            "action": "Manually renew TLS certificate via certbot",
+                            "risk": "low",
+                            "requires_approval": True,
+                        },
+                        {
+                            "step": 2,
+                            "action": "Fix DNS challenge configuration for auto-renewal",
+                            "risk": "low",
+                            "requires_approval": False,
+                        },
+                    ],
+                    "requires_human_approval": True,
+                    "summary": "Renew certificate immediately and fix auto-renewal.",
+                },
+                "input_tokens": 700,
+                "output_tokens": 220,
+            },
+        ),
+    },
+    # DNS resolution failure causing service connectivity issues.
+    {
+        "name": "dns_resolution_failure",
+        "alert": {
+            "service": "inventory-service",
+            "description": (
+                "DNS resolution failures for downstream"
+                " dependencies, NXDOMAIN errors"
+            ),
+            "severity": "high",
+            "timestamp": datetime(2024, 5, 20, 11, 15, 0, tzinfo=UTC),
+            "metadata": {
+                "nxdomain_count": 500,
+                "affected_domains": ["db.internal", "cache.internal"],
+            },
+        },
+        "expected_root_cause_keywords": (
+            "DNS", "resolution", "NXDOMAIN", "CoreDNS", "nameserver",
+        ),
+        "expected_remediation_keywords": (
+            "DNS", "restart", "CoreDNS", "nameserver", "config",
+        ),
+        "expected_affected_services": ("inventory-service",),
+        "min_confidence": 0.7,
+        "responses": (
+            {
+                "payload": {
+                    "classification": "network-dns",
+                    "affected_services": ["inventory-service"],
+                    "priority": "P1",
+                    "summary": "inventory-service unable to resolve internal DNS names.",
+                    "delegation_instructions": "Check CoreDNS pods and DNS configuration.",
+                },
+                "input_tokens": 420,
+                "output_tokens": 175,
+            },
+            {
+                "payload": {
+                    "root_cause": (
+                        "CoreDNS pods crashed due to OOM, causing"
+                        " NXDOMAIN errors for all internal"
+                        " service discovery."
+                    ),
+                    "confidence": 0.85,
+                    "evidence": [
+                        "CoreDNS pods in CrashLoopBackOff",
+                        "NXDOMAIN errors correlate with pod restarts",
+                    ],
+                    "affected_services": ["inventory-service"],
+                },
+                "input_tokens": 1400,
+                "output_tokens": 380,
+            },
+            {
+                "payload": {
+                    "remediation_steps": [
+                        {
+                            "step": 1,
+                            "action": "Restart CoreDNS pods with increased memory limits",
+                            "risk": "medium",
+                            "requires_approval": True,
+                        },
+                        {
+                            "step": 2,
+                            "action": "Add DNS caching sidecar to critical services",
+                            "risk": "low",
+                            "requires_approval": False,
+                        },
+                    ],
+                    "requires_human_approval": True,
+                    "summary": "Restart CoreDNS with more memory and add DNS caching.",
+                },
+                "input_tokens": 750,
+                "output_tokens": 230,
+            },
+        ),
+    },
+    # Kafka consumer lag causing event processing delays.
+    {
+        "name": "kafka_consumer_lag",
+        "alert": {
+            "service": "notification-service",
+            "description": (
+                "Kafka consumer lag exceeding 50,000 messages,"
+                " processing delay > 30 minutes"
+            ),
+            "severity": "high",
+            "timestamp": datetime(2024, 6, 12, 9, 30, 0, tzinfo=UTC),
+            "metadata": {"consumer_lag": 50000, "processing_delay_min": 30},
+        },
+        "expected_root_cause_keywords": (
+            "Kafka", "consumer", "lag", "throughput", "partition",
+        ),
+        "expected_remediation_keywords": (
+            "scale", "consumer", "partition", "throughput",
+        ),
+        "expected_affected_services": ("notification-service",),
+        "min_confidence": 0.6,
+        "responses": (
+            {
+                "payload": {
+                    "classification": "message-queue-lag",
+                    "affected_services": ["notification-service"],
+                    "priority": "P2",
+                    "summary": "notification-service Kafka consumer lag growing, events delayed.",
+                    "delegation_instructions": (
+                        "Check consumer group offsets and"
+                        " processing throughput."
+                    ),
+                },
+                "input_tokens": 410,
+                "output_tokens": 185,
+            },
+            {
+                "payload": {
+                    "root_cause": (
+                        "Spike in event volume combined with slow"
+                        " downstream API calls reduced consumer"
+                        " throughput below production rate."
+                    ),
+                    "confidence": 0.72,
+                    "evidence": ["Event volume 3x normal", "Downstream API p99 at 5s"],
+                    "affected_services": ["notification-service"],
+                },
+                "input_tokens": 1300,
+                "output_tokens": 360,
+            },
+            {
+                "payload": {
+                    "remediation_steps": [
+                        {
+                            "step": 1,
+                            "action": "Scale up consumer instances to match throughput",
+                            "risk": "low",
+                            "requires_approval": False,
+                        },
+                        {
+                            "step": 2,
+                            "action": "Add circuit breaker for slow downstream calls",
+                            "risk": "medium",
+                            "requires_approval": True,
+                        },
+                    ],
+                    "requires_human_approval": True,
+                    "summary": "Scale consumers and protect against slow dependencies.",
+                },
+                "input_tokens": 680,
+                "output_tokens": 210,
+            },
+        ),
+    },
+    # Disk space exhaustion on logging volume.
+    {
+        "name": "disk_space_exhaustion",
+        "alert": {
+            "service": "logging-service",
+            "description": "Disk usage at 95%, write failures detected, log ingestion stalled",
+            "severity": "critical",
+            "timestamp": datetime(2024, 7, 8, 3, 0, 0, tzinfo=UTC),
+            "metadata": {"disk_usage_pct": 95, "write_errors_per_min": 200},
+        },
+        "expected_root_cause_keywords": (
+            "disk", "space", "log rotation", "volume", "storage",
+        ),
+        "expected_remediation_keywords": (
+            "cleanup", "log rotation", "disk", "expand", "volume",
+        ),
+        "expected_affected_services": ("logging-service",),
+        "min_confidence": 0.8,
+        "responses": (
+            {
+                "payload": {
+                    "classification": "resource-exhaustion",
+                    "affected_services": ["logging-service"],
+                    "priority": "P1",
+                    "summary": "logging-service disk nearly full causing write failures.",
+                    "delegation_instructions": "Check disk usage and log rotation config.",
+                },
+                "input_tokens": 390,
+                "output_tokens": 165,
+            },
+            {
+                "payload": {
+                    "root_cause": (
+                        "Log rotation misconfigured after infra"
+                        " change \u2014 logs not being rotated,"
+                        " filling disk in 48 hours."
+                    ),
+                    "confidence": 0.88,
+                    "evidence": ["No logrotate runs in 48h", "Single log file >200GB"],
+                    "affected_services": ["logging-service"],
+                },
+                "input_tokens": 1100,
+                "output_tokens": 320,
+            },
+            {
+                "payload": {
+                    "remediation_steps": [
+                        {
+                            "step": 1,
+                            "action": "Clean up old log files to reclaim disk space",
+                            "risk": "low",
+                            "requires_approval": False,
+                        },
+                        {
+                            "step": 2,
+                            "action": "Fix log rotation configuration",
+                            "risk": "low",
+                            "requires_approval": False,
+                        },
+                        {
+                            "step": 3,
+                            "action": "Expand disk volume if needed",
+                            "risk": "medium",
+                            "requires_approval": True,
+                        },
+                    ],
+                    "requires_human_approval": True,
+                    "summary": "Clean logs, fix rotation, expand disk if needed.",
+                },
+                "input_tokens": 720,
+                "output_tokens": 240,
+            },
+        ),
+    },
+    # CPU spike caused by runaway regex in request parsing.
+    {
+        "name": "cpu_spike",
+        "alert": {
+            "service": "search-service",
+            "description": "CPU utilization at 98% across all pods, request latency 10x normal",
+            "severity": "critical",
+            "timestamp": datetime(2024, 8, 22, 15, 0, 0, tzinfo=UTC),
+            "metadata": {"cpu_pct": 98, "latency_multiplier": 10},
+        },
+        "expected_root_cause_keywords": (
+            "CPU", "regex", "parsing", "runaway", "compute",
+        ),
+        "expected_remediation_keywords": (
+            "scale", "fix regex", "CPU", "optimize", "limit",
+        ),
+        "expected_affected_services": ("search-service",),
+        "min_confidence": 0.7,
+        "responses": (
+            {
+                "payload": {
+                    "classification": "resource-exhaustion",
+                    "affected_services": ["search-service"],
+                    "priority": "P1",
+                    "summary": "search-service CPU saturated causing severe latency degradation.",
+                    "delegation_instructions": "Profile CPU usage and check recent code changes.",
+                },
+                "input_tokens": 430,
+                "output_tokens": 180,
+            },
+            {
+                "payload": {
+                    "root_cause": (
+                        "Runaway regex in query parsing causing"
+                        " catastrophic backtracking on certain"
+                        " search inputs, spiking CPU."
+                    ),
+                    "confidence": 0.82,
+                    "evidence": [
+                        "CPU profiler shows 90% in regex engine",
+                        "Issue triggered by specific query pattern",
+                    ],
+                    "affected_services": ["search-service"],
+                },
+                "input_tokens": 1600,
+                "output_tokens": 420,
+            },
+            {
+                "payload": {
+                    "remediation_steps": [
+                        {
+                            "step": 1,
+                            "action": "Scale up search-service pods to absorb CPU load",
+                            "risk": "low",
+                            "requires_approval": False,
+                        },
+                        {
+                            "step": 2,
+                            "action": "Fix regex to prevent catastrophic backtracking",
+                            "risk": "medium",
+                            "requires_approval": True,
+                        },
+                        {
+                            "step": 3,
+                            "action": "Add request timeout limits",
+                            "risk": "low",
+                            "requires_approval": False,
+                        },
+                    ],
+                    "requires_human_approval": True,
+                    "summary": "Scale up, fix the regex, and add timeouts.",
+                },
+                "input_tokens": 850,
+                "output_tokens": 260,
+            },
+        ),
+    },
+    # Rate limiting misconfiguration causing legitimate request drops.
+    {
+        "name": "rate_limiting",
+        "alert": {
+            "service": "api-gateway",
+            "description": (
+                "HTTP 429 responses spiked to 40% of all"
+                " requests, legitimate users affected"
+            ),
+            "severity": "high",
+            "timestamp": datetime(2024, 9, 3, 12, 0, 0, tzinfo=UTC),
+            "metadata": {"429_rate_pct": 40, "affected_users": 15000},
+        },
+        "expected_root_cause_keywords": (
+            "rate limit", "429", "throttle", "config", "threshold",
+        ),
+        "expected_remediation_keywords": (
+            "rate limit", "increase", "threshold", "config", "allowlist",
+        ),
+        "expected_affected_services": ("api-gateway",),
+        "min_confidence": 0.7,
+        "responses": (
+            {
+                "payload": {
+                    "classification": "misconfiguration",
+                    "affected_services": ["api-gateway"],
+                    "priority": "P2",
+                    "summary": (
+                        "api-gateway rate limiter too aggressive,"
+                        " blocking legitimate traffic."
+                    ),
+                    "delegation_instructions": "Check rate limit configuration and recent changes.",
+                },
+                "input_tokens": 400,
+                "output_tokens": 170,
+            },
+            {
+                "payload": {
+                    "root_cause": (
+                        "Rate limit threshold reduced from 1000"
+                        " to 100 req/min per user in recent config"
+                        " change, blocking normal traffic."
+                    ),
+                    "confidence": 0.90,
+                    "evidence": ["Config change deployed 2h ago", "Rate limit set to 100 req/min"],
+                    "affected_services": ["api-gateway"],
+                },
+                "input_tokens": 1300,
+                "output_tokens": 350,
+            },
+            {
+                "payload": {
+                    "remediation_steps": [
+                        {
+                            "step": 1,
+                            "action": "Revert rate limit config to 1000 req/min",
+                            "risk": "low",
+                            "requires_approval": True,
+                        },
+                        {
+                            "step": 2,
+                            "action": "Add monitoring alert for rate limit config changes",
+                            "risk": "low",
+                            "requires_approval": False,
+                        },
+                    ],
+                    "requires_human_approval": True,
+                    "summary": "Revert rate limit config and add change monitoring.",
+                },
+                "input_tokens": 700,
+                "output_tokens": 220,
+            },
+        ),
+    },
+    # Database replication lag causing stale reads.
+    {
+        "name": "database_replication_lag",
+        "alert": {
+            "service": "order-service",
+            "description": (
+                "Read replicas lagging 45 seconds behind"
+                " primary, stale data served to users"
+            ),
+            "severity": "high",
+            "timestamp": datetime(2024, 10, 18, 7, 30, 0, tzinfo=UTC),
+            "metadata": {"replication_lag_seconds": 45, "affected_reads_pct": 30},
+        },
+        "expected_root_cause_keywords": (
+            "replication", "lag", "replica", "primary", "database",
+        ),
+        "expected_remediation_keywords": (
+            "replication", "replica", "read routing", "primary",
+        ),
+        "expected_affected_services": ("order-service",),
+        "min_confidence": 0.6,
+        "responses": (
+            {
+                "payload": {
+                    "classification": "database-degradation",
+                    "affected_services": ["order-service"],
+                    "priority": "P2",
+                    "summary": (
+                        "order-service read replicas behind"
+                        " primary, users seeing stale data."
+                    ),
+                    "delegation_instructions": "Check replication status and write throughput.",
+                },
+                "input_tokens": 400,
+                "output_tokens": 175,
+            },
+            {
+                "payload": {
+                    "root_cause": (
+                        "Bulk data migration on primary database"
+                        " saturated replication bandwidth, causing"
+                        " replicas to fall behind."
+                    ),
+                    "confidence": 0.75,
+                    "evidence": ["Bulk write job started 1h ago", "Replication bandwidth at 100%"],
+                    "affected_services": ["order-service"],
+                },
+                "input_tokens": 1400,
+                "output_tokens": 370,
+            },
+            {
+                "payload": {
+                    "remediation_steps": [
+                        {
+                            "step": 1,
+                            "action": "Throttle bulk migration job to reduce write pressure",
+                            "risk": "medium",
+                            "requires_approval": True,
+                        },
+                        {
+                            "step": 2,
+                            "action": "Temporarily route critical reads to primary",
+                            "risk": "low",
+                            "requires_approval": True,
+                        },
+                    ],
+                    "requires_human_approval": True,
+                    "summary": "Throttle migration and route critical reads to primary.",
+                },
+                "input_tokens": 750,
+                "output_tokens": 230,
+            },
+        ),
+    },
+)
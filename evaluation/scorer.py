@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 from agent.models import IncidentReport
 from evaluation.scenarios._base import EvalScenario
 
 
-@dataclass
+@dataclass(frozen=True)
 class ScenarioScore:
     """Scoring breakdown for a single evaluated scenario."""
 
@@ -29,29 +33,134 @@ W_REMEDIATION = 0.30
 W_CONFIDENCE = 0.15
 W_SERVICES = 0.15
 
+# Below this many pairs, process start-up costs more than scoring inline
+PARALLEL_MIN_PAIRS = 64
 
-def _keyword_overlap(text: str, keywords: list[str]) -> float:
-    """Fraction of keywords found (case-insensitive) in text."""
-    if not keywords:
-        return 1.0
-    lower = text.lower()
-    matched = sum(1 for kw in keywords if kw.lower() in lower)
-    return matched / len(keywords)
 
+class _ReportKey(NamedTuple):
+    """The report fields scoring reads; also the score cache key."""
 
-def score_scenario(scenario: EvalScenario, report: IncidentReport) -> ScenarioScore:
-    """Score a single scenario result against its expected outputs."""
-    # 1. Root cause keyword match (40%)
-    root_cause_match = _keyword_overlap(
-        report.root_cause, scenario.expected_root_cause_keywords
+    root_cause: str
+    remediation_steps: tuple[str, ...]
+    confidence_score: float
+    service: str
+
+
+def _report_key(report: IncidentReport) -> _ReportKey:
+    return _ReportKey(
+        root_cause=report.root_cause,
+        remediation_steps=tuple(report.remediation_steps),
+        confidence_score=report.confidence_score,
+        service=report.alert.service,
     )
 
-    # 2. Remediation keyword coverage (30%)
+
+class _ReportText(NamedTuple):
+    """Lowercased report text, computed once and reused across scenarios."""
+
+    root_cause_lc: str
+    remediation_lc: str
+    all_lc: str
+    service_lc: str
+
+
+def _prepare_report(report: _ReportKey) -> _ReportText:
+    root_cause = report.root_cause
     remediation_text = " ".join(report.remediation_steps)
-    remediation_coverage = _keyword_overlap(
-        remediation_text, scenario.expected_remediation_keywords
+    all_text = root_cause + " " + remediation_text
+    # Lowercase once and slice out the two buckets. A few characters (e.g. "İ")
+    # change length when lowered; fall back to lowering each part if so.
+    all_lc = all_text.lower()
+    if len(all_lc) == len(all_text):
+        split = len(root_cause)
+        root_cause_lc, remediation_lc = all_lc[:split], all_lc[split + 1:]
+    else:
+        root_cause_lc = root_cause.lower()
+        remediation_lc = remediation_text.lower()
+        all_lc = root_cause_lc + " " + remediation_lc
+    return _ReportText(
+        root_cause_lc=root_cause_lc,
+        remediation_lc=remediation_lc,
+        all_lc=all_lc,
+        service_lc=report.service.lower(),
     )
 
+
+@dataclass(frozen=True, slots=True)
+class _Keyed:
+    """Hashable stand-in for an object, hashed and compared by a derived key only."""
+
+    key: tuple[Any, ...]
+    value: Any = field(compare=False)
+
+
+def _scenario_key(scenario: EvalScenario) -> tuple[Any, ...]:
+    return (
+        scenario.name,
+        scenario.root_cause_keywords_lc,
+        scenario.remediation_keywords_lc,
+        scenario.affected_services_lc,
+        scenario.min_confidence,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _score_cached(scenario: _Keyed, report: _ReportKey) -> ScenarioScore:
+    # Scored from the key itself, so a cached entry always matches its key
+    return _score_prepared(scenario.value, report, _prepare_report(report))
+
+
+def score_scenario(scenario: EvalScenario, report: IncidentReport) -> ScenarioScore:
+    """Score a single scenario result against its expected outputs.
+
+    Results are memoized on the scenario's expectations and the scored report
+    fields, so re-scoring an identical report is a cache hit.
+    """
+    return _score_cached(_Keyed(_scenario_key(scenario), scenario), _report_key(report))
+
+
+def score_all(
+    reports: Sequence[IncidentReport],
+    scenarios: Sequence[EvalScenario],
+) -> list[ScenarioScore]:
+    """Score every report against every scenario, report-major.
+
+    Each report's text is lowercased and joined once, then reused for all scenarios.
+    """
+    scores: list[ScenarioScore] = []
+    for report in reports:
+        key = _report_key(report)
+        text = _prepare_report(key)
+        scores.extend(_score_prepared(scenario, key, text) for scenario in scenarios)
+    return scores
+
+
+def _score_pair(pair: tuple[EvalScenario, IncidentReport]) -> ScenarioScore:
+    return score_scenario(*pair)
+
+
+def score_many(
+    pairs: Sequence[tuple[EvalScenario, IncidentReport]],
+    max_workers: int | None = None,
+) -> list[ScenarioScore]:
+    """Score (scenario, report) pairs, fanning out to worker processes for large sweeps."""
+    if len(pairs) < PARALLEL_MIN_PAIRS:
+        return [_score_pair(pair) for pair in pairs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_score_pair, pairs, chunksize=8))
+
+
+def _score_prepared(
+    scenario: EvalScenario,
+    report: _ReportKey,
+    text: _ReportText,
+) -> ScenarioScore:
+    # 1. Root cause keyword match (40%)
+    root_cause_match = scenario.root_cause_matcher.overlap(text.root_cause_lc)
+
+    # 2. Remediation keyword coverage (30%)
+    remediation_coverage = scenario.remediation_matcher.overlap(text.remediation_lc)
+
     # 3. Confidence calibration (15%) — closeness to min_confidence
     if report.confidence_score >= scenario.min_confidence:
         confidence_calibration = 1.0
@@ -61,15 +170,18 @@ def score_scenario(scenario: EvalScenario, report: IncidentReport) -> ScenarioSc
         )
 
     # 4. Affected services accuracy (15%)
-    expected = {s.lower() for s in scenario.expected_affected_services}
+    expected = scenario.affected_services_set
     # Extract affected services from the alert (the report's alert.service)
-    # and from remediation text or root cause
-    found: set[str] = set()
-    all_text = (report.root_cause + " " + " ".join(report.remediation_steps)).lower()
-    for svc in expected:
-        if svc in all_text or svc == report.alert.service.lower():
-            found.add(svc)
-    affected_services_accuracy = len(found) / len(expected) if expected else 1.0
+    # and from remediation text or root cause. One regex pass finds the longest
+    # service at each position; a hit also covers any service that is its prefix.
+    pattern = scenario.services_pattern
+    hits = set(pattern.findall(text.all_lc)) if pattern is not None else set()
+    service_lc = text.service_lc
+    found = sum(
+        1 for svc in expected
+        if svc == service_lc or any(hit.startswith(svc) for hit in hits)
+    )
+    affected_services_accuracy = found / len(expected) if expected else 1.0
 
     total = (
         W_ROOT_CAUSE * root_cause_match
@@ -1,5 +1,10 @@
 #!/usr/bin/env python3
-"""CDK app entry point for Sentinel infrastructure."""
+"""CDK app entry point for Sentinel infrastructure.
+
+Construct stack-trace capture is disabled via the "aws:cdk:disable-stack-trace"
+context flag in cdk.json; it dominates synth time and is only useful when
+debugging construct origins (override with -c aws:cdk:disable-stack-trace=false).
+"""
 
 import aws_cdk as cdk
 from stack import SentinelStack
@@ -10,8 +15,8 @@ SentinelStack(
     app,
     "SentinelStack",
     env=cdk.Environment(
-        account="392746353271",
-        region="us-east-1",
+        account=app.node.try_get_context("account") or "392746353271",
+        region=app.node.try_get_context("region") or "us-east-1",
     ),
 )
 
@@ -44,6 +44,14 @@ from aws_cdk import (
 from constructs import Construct
 
 
+def _context_flag(construct: Construct, key: str) -> bool:
+    """Read a boolean context flag; -c values arrive as strings like "true"."""
+    value = construct.node.try_get_context(key)
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes")
+    return bool(value)
+
+
 class SentinelStack(Stack):
     """AWS CDK stack deploying Sentinel on ECS Fargate with ALB, ECR, and Route 53."""
 
@@ -52,6 +60,9 @@ class SentinelStack(Stack):
 
         domain_name = self.node.try_get_context("domain_name") or "agent.ojasavaparas.com"
         hosted_zone_name = self.node.try_get_context("hosted_zone_name") or "ojasavaparas.com"
+        # Fast topology-only synth: -c skip_dns=true -c skip_github_oidc=true
+        skip_dns = _context_flag(self, "skip_dns")
+        skip_github_oidc = _context_flag(self, "skip_github_oidc")
 
         vpc = ec2.Vpc(
             self,
@@ -104,18 +115,44 @@ class SentinelStack(Stack):
             removal_policy=RemovalPolicy.RETAIN,
         )
 
-        hosted_zone = route53.HostedZone.from_lookup(
-            self,
-            "HostedZone",
-            domain_name=hosted_zone_name,
-        )
+        hosted_zone = None
+        certificate = None
+        if not skip_dns:
+            # With a known zone ID, skip the from_lookup context query (an AWS API call
+            # on any synth without a cached cdk.context.json entry)
+            hosted_zone_id = self.node.try_get_context("hosted_zone_id")
+            if hosted_zone_id:
+                hosted_zone = route53.HostedZone.from_hosted_zone_attributes(
+                    self,
+                    "HostedZone",
+                    hosted_zone_id=hosted_zone_id,
+                    zone_name=hosted_zone_name,
+                )
+            else:
+                hosted_zone = route53.HostedZone.from_lookup(
+                    self,
+                    "HostedZone",
+                    domain_name=hosted_zone_name,
+                )
+
+            certificate = acm.Certificate(
+                self,
+                "SentinelCert",
+                domain_name=domain_name,
+                validation=acm.CertificateValidation.from_dns(hosted_zone),
+            )
 
-        certificate = acm.Certificate(
-            self,
-            "SentinelCert",
-            domain_name=domain_name,
-            validation=acm.CertificateValidation.from_dns(hosted_zone),
-        )
+        # A complete ARN (with the random suffix) gives an exact IAM resource
+        # instead of the name-based wildcard match
+        anthropic_secret_arn = self.node.try_get_context("anthropic_secret_arn")
+        if anthropic_secret_arn:
+            anthropic_secret = secretsmanager.Secret.from_secret_complete_arn(
+                self, "AnthropicApiKey", anthropic_secret_arn
+            )
+        else:
+            anthropic_secret = secretsmanager.Secret.from_secret_name_v2(
+                self, "AnthropicApiKey", "sentinel/anthropic-api-key"
+            )
 
         task_definition = ecs.FargateTaskDefinition(
             self,
@@ -138,17 +175,11 @@ class SentinelStack(Stack):
                 "DYNAMODB_TABLE_NAME": incidents_table.table_name,
             },
             secrets={
-                "ANTHROPIC_API_KEY": ecs.Secret.from_secrets_manager(
-                    secretsmanager.Secret.from_secret_name_v2(
-                        self, "AnthropicApiKey", "sentinel/anthropic-api-key"
-                    )
-                ),
+                "ANTHROPIC_API_KEY": ecs.Secret.from_secrets_manager(anthropic_secret),
             },
             health_check=ecs.HealthCheck(
-                command=[
-                    "CMD-SHELL",
-                    "python -c \"import urllib.request; urllib.request.urlopen('http://localhost:8000/api/v1/health')\"",
-                ],
+                # curl is installed in the image; avoids starting Python per probe
+                command=["CMD-SHELL", "curl -fsS http://localhost:8000/api/v1/health || exit 1"],
                 interval=Duration.seconds(30),
                 timeout=Duration.seconds(5),
                 retries=3,
@@ -162,24 +193,23 @@ class SentinelStack(Stack):
 
         incidents_table.grant_read_write_data(task_definition.task_role)
 
-        alb_sg = ec2.SecurityGroup(
-            self,
+        any_ipv4 = ec2.Peer.any_ipv4()
+        alb_ingress = [(any_ipv4, ec2.Port.tcp(80), "HTTP")]
+        if certificate is not None:
+            alb_ingress.append((any_ipv4, ec2.Port.tcp(443), "HTTPS"))
+        alb_sg = self._security_group(
             "AlbSg",
-            vpc=vpc,
-            description="ALB security group - allow HTTP/HTTPS from anywhere",
-            allow_all_outbound=True,
+            vpc,
+            "ALB security group - allow HTTP/HTTPS from anywhere",
+            alb_ingress,
         )
-        alb_sg.add_ingress_rule(ec2.Peer.any_ipv4(), ec2.Port.tcp(80), "HTTP")
-        alb_sg.add_ingress_rule(ec2.Peer.any_ipv4(), ec2.Port.tcp(443), "HTTPS")
 
-        fargate_sg = ec2.SecurityGroup(
-            self,
+        fargate_sg = self._security_group(
             "FargateSg",
-            vpc=vpc,
-            description="Fargate security group - allow traffic only from ALB",
-            allow_all_outbound=True,
+            vpc,
+            "Fargate security group - allow traffic only from ALB",
+            [(alb_sg, ec2.Port.tcp(8000), "From ALB")],
         )
-        fargate_sg.add_ingress_rule(alb_sg, ec2.Port.tcp(8000), "From ALB")
 
         alb = elbv2.ApplicationLoadBalancer(
             self,
@@ -190,24 +220,29 @@ class SentinelStack(Stack):
             idle_timeout=Duration.seconds(120),
         )
 
-        https_listener = alb.add_listener(
-            "HttpsListener",
-            port=443,
-            certificates=[certificate],
-            default_action=elbv2.ListenerAction.fixed_response(
-                status_code=404, content_type="text/plain", message_body="Not found"
-            ),
+        not_found = elbv2.ListenerAction.fixed_response(
+            status_code=404, content_type="text/plain", message_body="Not found"
         )
+        if certificate is None:
+            # No certificate without DNS validation: serve plain HTTP only
+            listener = alb.add_listener("HttpListener", port=80, default_action=not_found)
+        else:
+            listener = alb.add_listener(
+                "HttpsListener",
+                port=443,
+                certificates=[certificate],
+                default_action=not_found,
+            )
 
-        alb.add_listener(
-            "HttpRedirect",
-            port=80,
-            default_action=elbv2.ListenerAction.redirect(
-                protocol="HTTPS",
-                port="443",
-                permanent=True,
-            ),
-        )
+            alb.add_listener(
+                "HttpRedirect",
+                port=80,
+                default_action=elbv2.ListenerAction.redirect(
+                    protocol="HTTPS",
+                    port="443",
+                    permanent=True,
+                ),
+            )
 
         fargate_service = ecs.FargateService(
             self,
@@ -220,7 +255,7 @@ class SentinelStack(Stack):
             vpc_subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS),
         )
 
-        https_listener.add_targets(
+        listener.add_targets(
             "SentinelTargets",
             port=8000,
             targets=[fargate_service],
@@ -248,59 +283,83 @@ class SentinelStack(Stack):
             scale_out_cooldown=Duration.seconds(60),
         )
 
-        route53.ARecord(
-            self,
-            "SentinelDns",
-            zone=hosted_zone,
-            record_name=domain_name,
-            target=route53.RecordTarget.from_alias(targets.LoadBalancerTarget(alb)),
-        )
+        if hosted_zone is not None:
+            route53.ARecord(
+                self,
+                "SentinelDns",
+                zone=hosted_zone,
+                record_name=domain_name,
+                target=route53.RecordTarget.from_alias(targets.LoadBalancerTarget(alb)),
+            )
 
-        github_repo = self.node.try_get_context("github_repo") or "ojasavaparas/Sentinel"
+        github_actions_role = None
+        if not skip_github_oidc:
+            github_repo = self.node.try_get_context("github_repo") or "ojasavaparas/Sentinel"
 
-        github_oidc_provider = iam.OpenIdConnectProvider(
-            self,
-            "GitHubOidc",
-            url="https://token.actions.githubusercontent.com",
-            client_ids=["sts.amazonaws.com"],
-        )
+            github_oidc_provider = iam.OpenIdConnectProvider(
+                self,
+                "GitHubOidc",
+                url="https://token.actions.githubusercontent.com",
+                client_ids=["sts.amazonaws.com"],
+            )
 
-        github_actions_role = iam.Role(
-            self,
-            "GitHubActionsRole",
-            role_name="github-actions-sentinel",
-            assumed_by=iam.FederatedPrincipal(
-                github_oidc_provider.open_id_connect_provider_arn,
-                conditions={
-                    "StringEquals": {
-                        "token.actions.githubusercontent.com:aud": "sts.amazonaws.com",
-                    },
-                    "StringLike": {
-                        "token.actions.githubusercontent.com:sub": f"repo:{github_repo}:*",
+            github_actions_role = iam.Role(
+                self,
+                "GitHubActionsRole",
+                role_name="github-actions-sentinel",
+                assumed_by=iam.FederatedPrincipal(
+                    github_oidc_provider.open_id_connect_provider_arn,
+                    conditions={
+                        "StringEquals": {
+                            "token.actions.githubusercontent.com:aud": "sts.amazonaws.com",
+                        },
+                        "StringLike": {
+                            "token.actions.githubusercontent.com:sub": f"repo:{github_repo}:*",
+                        },
                     },
-                },
-                assume_role_action="sts:AssumeRoleWithWebIdentity",
-            ),
-        )
+                    assume_role_action="sts:AssumeRoleWithWebIdentity",
+                ),
+            )
 
-        repository.grant_pull_push(github_actions_role)
-
-        github_actions_role.add_to_policy(
-            iam.PolicyStatement(
-                actions=[
-                    "ecs:UpdateService",
-                    "ecs:DescribeServices",
-                    "ecs:DescribeTaskDefinition",
-                    "ecs:RegisterTaskDefinition",
-                    "iam:PassRole",
-                ],
-                resources=["*"],
+            repository.grant_pull_push(github_actions_role)
+
+            github_actions_role.add_to_policy(
+                iam.PolicyStatement(
+                    actions=[
+                        "ecs:UpdateService",
+                        "ecs:DescribeServices",
+                        "ecs:DescribeTaskDefinition",
+                        "ecs:RegisterTaskDefinition",
+                        "iam:PassRole",
+                    ],
+                    resources=["*"],
+                )
             )
-        )
 
         cdk.CfnOutput(self, "AlbDnsName", value=alb.load_balancer_dns_name)
         cdk.CfnOutput(self, "EcrRepoUri", value=repository.repository_uri)
-        cdk.CfnOutput(self, "ServiceUrl", value=f"https://{domain_name}")
-        cdk.CfnOutput(
-            self, "GitHubActionsRoleArn", value=github_actions_role.role_arn
+        if hosted_zone is not None:
+            cdk.CfnOutput(self, "ServiceUrl", value=f"https://{domain_name}")
+        if github_actions_role is not None:
+            cdk.CfnOutput(
+                self, "GitHubActionsRoleArn", value=github_actions_role.role_arn
+            )
+
+    def _security_group(
+        self,
+        construct_id: str,
+        vpc: ec2.IVpc,
+        description: str,
+        ingress: list[tuple[ec2.IPeer, ec2.Port, str]],
+    ) -> ec2.SecurityGroup:
+        """Create a security group with all outbound allowed and the given ingress rules."""
+        security_group = ec2.SecurityGroup(
+            self,
+            construct_id,
+            vpc=vpc,
+            description=description,
+            allow_all_outbound=True,
         )
+        for peer, port, rule_description in ingress:
+            security_group.add_ingress_rule(peer, port, rule_description)
+        return security_group
@@ -2,8 +2,17 @@
 
 from __future__ import annotations
 
+import heapq
+import threading
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from itertools import islice
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # Claude Sonnet pricing (per token)
 CLAUDE_SONNET_INPUT = 3.0 / 1_000_000
@@ -15,7 +24,12 @@ def calculate_cost(input_tokens: int, output_tokens: int) -> float:
     return input_tokens * CLAUDE_SONNET_INPUT + output_tokens * CLAUDE_SONNET_OUTPUT
 
 
-@dataclass
+def calculate_cost_batch(input_tokens: np.ndarray, output_tokens: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_cost over arrays of input/output token counts."""
+    return input_tokens * CLAUDE_SONNET_INPUT + output_tokens * CLAUDE_SONNET_OUTPUT
+
+
+@dataclass(slots=True)
 class AnalysisCost:
     """Accumulated cost data for a single incident analysis."""
 
@@ -26,13 +40,27 @@ class AnalysisCost:
     total_input_tokens: int = 0
     total_output_tokens: int = 0
     tool_call_count: int = 0
+    # Monotonic clock reading at creation; used for time-window filtering
+    created_at: float = field(default_factory=time.monotonic)
 
 
 class CostTracker:
     """Tracks per-incident LLM cost across the agent pipeline."""
 
-    def __init__(self) -> None:
+    def __init__(self, max_entries: int = 10_000, ttl_hours: float = 48) -> None:
+        # Insertion order is creation order, so older analyses form a prefix
         self._analyses: dict[str, AnalysisCost] = {}
+        # Retention bounds: analyses past the TTL, or beyond max_entries, are evicted
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_hours * 3600
+        # Running aggregates, kept current by record_analysis
+        self._total_cost = 0.0
+        # Max-heap of (-cost, incident_id); entries go stale as costs grow and
+        # are discarded lazily when they surface at the top
+        self._top: list[tuple[float, str]] = []
+        # One lock guards the dict, the running total and the heap together:
+        # every update touches all three, so finer-grained locking cannot help
+        self._lock = threading.Lock()
 
     def record_analysis(
         self,
@@ -43,8 +71,53 @@ class CostTracker:
     ) -> None:
         """Accumulate token usage and cost for one agent within an analysis."""
         cost = calculate_cost(input_tokens, output_tokens)
-
+        with self._lock:
+            self._add(incident_id, agent_name, input_tokens, output_tokens, cost)
+
+    def bulk_record(self, rows: Iterable[tuple[str, str, int, int]]) -> None:
+        """Record many (incident_id, agent_name, input_tokens, output_tokens) rows.
+
+        Costs are computed in one vectorized pass and summed per
+        (incident, agent) before being applied, e.g. when replaying history.
+        """
+        import numpy as np
+
+        rows = list(rows)
+        if not rows:
+            return
+        incident_ids, agent_names, input_tokens, output_tokens = zip(*rows)
+        inputs = np.fromiter(input_tokens, dtype=np.int64, count=len(rows))
+        outputs = np.fromiter(output_tokens, dtype=np.int64, count=len(rows))
+        costs = calculate_cost_batch(inputs, outputs)
+
+        # Group ids in first-seen order so new analyses keep creation order
+        keys = list(zip(incident_ids, agent_names))
+        group_of = {key: i for i, key in enumerate(dict.fromkeys(keys))}
+        groups = np.fromiter(map(group_of.__getitem__, keys), dtype=np.intp, count=len(rows))
+        n_groups = len(group_of)
+        cost_sums = np.bincount(groups, weights=costs, minlength=n_groups)
+        input_sums = np.zeros(n_groups, dtype=np.int64)
+        output_sums = np.zeros(n_groups, dtype=np.int64)
+        np.add.at(input_sums, groups, inputs)
+        np.add.at(output_sums, groups, outputs)
+
+        with self._lock:
+            for (incident_id, agent_name), cost, n_in, n_out in zip(
+                group_of, cost_sums.tolist(), input_sums.tolist(), output_sums.tolist()
+            ):
+                self._add(incident_id, agent_name, n_in, n_out, cost)
+
+    def _add(
+        self,
+        incident_id: str,
+        agent_name: str,
+        input_tokens: int,
+        output_tokens: int,
+        cost: float,
+    ) -> None:
+        # Caller holds self._lock
         if incident_id not in self._analyses:
+            self._evict()
             self._analyses[incident_id] = AnalysisCost(incident_id=incident_id)
 
         entry = self._analyses[incident_id]
@@ -53,32 +126,48 @@ class CostTracker:
         entry.total_output_tokens += output_tokens
         entry.by_agent[agent_name] = entry.by_agent.get(agent_name, 0.0) + cost
 
+        self._total_cost += cost
+        heapq.heappush(self._top, (-entry.total_cost, incident_id))
+        if len(self._top) > 2 * len(self._analyses) + 16:
+            self._rebuild_top()
+
     def record_tool_calls(self, incident_id: str, count: int) -> None:
         """Increment the tool call count for an analysis."""
-        if incident_id in self._analyses:
-            self._analyses[incident_id].tool_call_count += count
+        with self._lock:
+            if incident_id in self._analyses:
+                self._analyses[incident_id].tool_call_count += count
 
     def get_analysis_cost(self, incident_id: str) -> dict[str, object]:
         """Return cost breakdown for a single analysis."""
-        entry = self._analyses.get(incident_id)
-        if entry is None:
-            return {"total": 0.0, "by_agent": {}, "tool_call_count": 0}
+        with self._lock:
+            entry = self._analyses.get(incident_id)
+            if entry is None:
+                return {"total": 0.0, "by_agent": {}, "tool_call_count": 0}
 
-        return {
-            "total": round(entry.total_cost, 6),
-            "by_agent": {k: round(v, 6) for k, v in entry.by_agent.items()},
-            "tool_call_count": entry.tool_call_count,
-        }
+            return {
+                "total": round(entry.total_cost, 6),
+                "by_agent": {k: round(v, 6) for k, v in entry.by_agent.items()},
+                "tool_call_count": entry.tool_call_count,
+            }
 
     def get_cost_summary(self, last_n_hours: int = 24) -> dict[str, object]:
         """Return aggregate cost summary for recent analyses."""
-        cutoff = datetime.now(UTC).timestamp() - last_n_hours * 3600
-        recent = [
-            a for a in self._analyses.values()
-            if a.timestamp.timestamp() >= cutoff
-        ]
-
-        if not recent:
+        with self._lock:
+            return self._cost_summary(last_n_hours)
+
+    def _cost_summary(self, last_n_hours: int) -> dict[str, object]:
+        cutoff = time.monotonic() - last_n_hours * 3600
+
+        # Only the (usually empty) prefix of analyses older than the window is
+        # walked; everything else comes from the running aggregates.
+        old: list[AnalysisCost] = []
+        for a in self._analyses.values():
+            if a.created_at >= cutoff:
+                break
+            old.append(a)
+        count = len(self._analyses) - len(old)
+
+        if count == 0:
             return {
                 "total_cost": 0.0,
                 "avg_cost_per_analysis": 0.0,
@@ -86,15 +175,51 @@ class CostTracker:
                 "total_analyses": 0,
             }
 
-        total_cost = sum(a.total_cost for a in recent)
-        most_expensive = max(recent, key=lambda a: a.total_cost)
+        total_cost = self._total_cost - sum(a.total_cost for a in old)
+        if old:
+            most_expensive = max(
+                islice(self._analyses.values(), len(old), None),
+                key=lambda a: a.total_cost,
+            )
+        else:
+            most_expensive = self._most_expensive()
 
         return {
             "total_cost": round(total_cost, 6),
-            "avg_cost_per_analysis": round(total_cost / len(recent), 6),
+            "avg_cost_per_analysis": round(total_cost / count, 6),
             "most_expensive_analysis": {
                 "incident_id": most_expensive.incident_id,
                 "cost": round(most_expensive.total_cost, 6),
             },
-            "total_analyses": len(recent),
+            "total_analyses": count,
         }
+
+    def _evict(self) -> None:
+        """Drop expired analyses, then the oldest until there is room for one more."""
+        cutoff = time.monotonic() - self._ttl_seconds
+        analyses = self._analyses
+        while analyses:
+            oldest = next(iter(analyses.values()))
+            if oldest.created_at >= cutoff and len(analyses) < self._max_entries:
+                break
+            del analyses[oldest.incident_id]
+            self._total_cost -= oldest.total_cost
+        if not analyses:
+            # Reset rather than carry float drift from repeated subtraction
+            self._total_cost = 0.0
+            self._top.clear()
+
+    def _rebuild_top(self) -> None:
+        """Drop stale heap entries, leaving one per tracked analysis."""
+        self._top = [(-a.total_cost, a.incident_id) for a in self._analyses.values()]
+        heapq.heapify(self._top)
+
+    def _most_expensive(self) -> AnalysisCost:
+        """Return the costliest tracked analysis, discarding stale heap entries."""
+        top = self._top
+        while True:
+            neg_cost, incident_id = top[0]
+            entry = self._analyses.get(incident_id)
+            if entry is not None and entry.total_cost == -neg_cost:
+                return entry
+            heapq.heappop(top)
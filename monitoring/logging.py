@@ -5,9 +5,30 @@ from __future__ import annotations
 import logging
 import os
 import sys
+from typing import Any
 
+import orjson
 import structlog
 
+_SHARED_PROCESSORS: tuple[structlog.types.Processor, ...] = (
+    structlog.contextvars.merge_contextvars,
+    structlog.stdlib.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+)
+
+
+def _orjson_dumps(obj: Any, default: Any = None, **_: Any) -> str:
+    # ProcessorFormatter needs str; non-str keys can appear in nested log values
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_JSON_RENDERER = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+
+# (format, level) of the last configure_logging call; repeat calls are no-ops
+_configured_for: tuple[str, int] | None = None
+
 
 def configure_logging() -> None:
     """Set up structlog with JSON or console rendering based on LOG_FORMAT env var.
@@ -19,22 +40,19 @@ def configure_logging() -> None:
     log_level_name = os.environ.get("LOG_LEVEL", "INFO").upper()
     log_level = getattr(logging, log_level_name, logging.INFO)
 
-    shared_processors: list[structlog.types.Processor] = [
-        structlog.contextvars.merge_contextvars,
-        structlog.stdlib.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-    ]
+    global _configured_for
+    if _configured_for == (log_format, log_level):
+        return
+    _configured_for = (log_format, log_level)
 
     if log_format == "json":
-        renderer: structlog.types.Processor = structlog.processors.JSONRenderer()
+        renderer: structlog.types.Processor = _JSON_RENDERER
     else:
         renderer = structlog.dev.ConsoleRenderer()
 
     structlog.configure(
         processors=[
-            *shared_processors,
+            *_SHARED_PROCESSORS,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
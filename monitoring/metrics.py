@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import collections
+from functools import cache
 from typing import TYPE_CHECKING
 
 from prometheus_client import Counter, Gauge, Histogram
 
+from tools.registry import TOOL_SCHEMAS
+
 if TYPE_CHECKING:
     from agent.models import IncidentReport
 
@@ -20,7 +24,7 @@ sentinel_incident_analyses_total = Counter(
 sentinel_incident_analysis_duration_seconds = Histogram(
     "sentinel_incident_analysis_duration_seconds",
     "Time spent analyzing an incident end-to-end",
-    buckets=[1, 5, 10, 30, 60, 120],
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
 )
 
 # --- Agent metrics ---
@@ -43,9 +47,14 @@ sentinel_tool_call_duration_seconds = Histogram(
     "sentinel_tool_call_duration_seconds",
     "Tool call latency in seconds",
     ["tool_name"],
-    buckets=[0.01, 0.05, 0.1, 0.5, 1.0, 5.0],
+    # Exponential: 5 ms doubling up to ~10 s
+    buckets=tuple(0.005 * 2**i for i in range(12)),
 )
 
+# Tool names come from LLM output; anything outside the registered tools is
+# recorded as "other" so the tool_name label cannot grow without bound.
+KNOWN_TOOLS = frozenset(schema["name"] for schema in TOOL_SCHEMAS)
+
 # --- LLM token / cost metrics ---
 
 sentinel_llm_tokens_total = Counter(
@@ -83,6 +92,8 @@ sentinel_rag_low_confidence_total = Counter(
 sentinel_active_analyses = Gauge(
     "sentinel_active_analyses",
     "Number of incident analyses currently in progress",
+    # Sum over live workers when PROMETHEUS_MULTIPROC_DIR is set; ignored otherwise
+    multiprocess_mode="livesum",
 )
 
 sentinel_human_approval_required_total = Counter(
@@ -91,13 +102,46 @@ sentinel_human_approval_required_total = Counter(
 )
 
 
+# --- Label-bound children ---
+# .labels() hashes the label values and looks the child up under a lock on every
+# call; label sets here are small and fixed, so bind each child once and reuse it.
+
+
+@cache
+def _tool_children(tool_name: str) -> tuple[Counter, Histogram]:
+    return (
+        sentinel_tool_calls_total.labels(tool_name=tool_name),
+        sentinel_tool_call_duration_seconds.labels(tool_name=tool_name),
+    )
+
+
+@cache
+def _llm_children(agent_name: str) -> tuple[Counter, Counter, Counter]:
+    return (
+        sentinel_llm_tokens_total.labels(direction="input", agent_name=agent_name),
+        sentinel_llm_tokens_total.labels(direction="output", agent_name=agent_name),
+        sentinel_llm_cost_dollars_total.labels(agent_name=agent_name),
+    )
+
+
+@cache
+def _agent_steps(agent_name: str) -> Counter:
+    return sentinel_agent_steps_total.labels(agent_name=agent_name)
+
+
+@cache
+def _incident_analyses(severity: str) -> Counter:
+    return sentinel_incident_analyses_total.labels(severity=severity)
+
+
 # --- Helper functions ---
 
 
 def record_tool_call(tool_name: str, duration_seconds: float) -> None:
     """Record a single tool call: increment counter and observe latency histogram."""
-    sentinel_tool_calls_total.labels(tool_name=tool_name).inc()
-    sentinel_tool_call_duration_seconds.labels(tool_name=tool_name).observe(duration_seconds)
+    calls, duration = _tool_children(tool_name if tool_name in KNOWN_TOOLS else "other")
+    calls.inc()
+    duration.observe(duration_seconds)
 
 
 def record_llm_call(
@@ -107,28 +151,36 @@ def record_llm_call(
     cost: float,
 ) -> None:
     """Record LLM token usage and cost for an agent run."""
-    sentinel_llm_tokens_total.labels(direction="input", agent_name=agent_name).inc(input_tokens)
-    sentinel_llm_tokens_total.labels(direction="output", agent_name=agent_name).inc(output_tokens)
-    sentinel_llm_cost_dollars_total.labels(agent_name=agent_name).inc(cost)
+    input_counter, output_counter, cost_counter = _llm_children(agent_name)
+    input_counter.inc(input_tokens)
+    output_counter.inc(output_tokens)
+    cost_counter.inc(cost)
 
 
 def record_rag_query(scores: list[float]) -> None:
     """Record a RAG query: increment counter, observe score histogram, track low confidence."""
     sentinel_rag_queries_total.inc()
+    # Observe and track the top score in one pass over the scores
+    observe = sentinel_rag_retrieval_score.observe
+    top = float("-inf")
     for score in scores:
-        sentinel_rag_retrieval_score.observe(score)
-    if scores and max(scores) < 0.4:
+        observe(score)
+        if score > top:
+            top = score
+    if scores and top < 0.4:
         sentinel_rag_low_confidence_total.inc()
 
 
 def record_analysis_complete(report: IncidentReport) -> None:
     """Record metrics from a completed incident analysis report."""
-    sentinel_incident_analyses_total.labels(severity=report.alert.severity).inc()
+    _incident_analyses(report.alert.severity).inc()
     sentinel_incident_analysis_duration_seconds.observe(report.duration_seconds)
 
     if report.requires_human_approval:
         sentinel_human_approval_required_total.inc()
 
-    # Count agent steps and record per-step metrics
-    for step in report.agent_trace:
-        sentinel_agent_steps_total.labels(agent_name=step.agent_name).inc()
+    # Count agent steps in one pass, then take each child's lock once per agent.
+    # Tool calls are already recorded by the registry as they execute.
+    steps_per_agent = collections.Counter(step.agent_name for step in report.agent_trace)
+    for agent_name, steps in steps_per_agent.items():
+        _agent_steps(agent_name).inc(steps)
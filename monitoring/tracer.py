@@ -3,29 +3,61 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
+import orjson
 import structlog
 
 from agent.models import AgentStep, StreamEvent, ToolCall
 
 logger = structlog.get_logger()
 
+# Indented like the previous json.dumps(indent=2); tool arguments/results may
+# carry non-string keys, which json.dumps coerced to strings
+_EXPORT_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+@dataclass(slots=True)
+class _TraceTotals:
+    """Running totals for one trace, kept current by log_step."""
+
+    tokens: int = 0
+    cost: float = 0.0
+
 
 class DecisionTracer:
     """Records and retrieves the full decision trace for an incident analysis."""
 
-    def __init__(self, event_queue: asyncio.Queue[StreamEvent] | None = None) -> None:
-        self._traces: dict[str, list[AgentStep]] = {}
+    def __init__(
+        self,
+        event_queue: asyncio.Queue[StreamEvent] | None = None,
+        max_traces: int = 1000,
+    ) -> None:
+        # Least recently written trace first; beyond max_traces the oldest is dropped
+        self._traces: OrderedDict[str, list[AgentStep]] = OrderedDict()
+        self._totals: dict[str, _TraceTotals] = {}
+        self._max_traces = max_traces
         self._event_queue = event_queue
+        # Per-trace callbacks invoked with each step as it is logged
+        self._step_callbacks: dict[str, Callable[[AgentStep], None]] = {}
 
     def start_trace(self, trace_id: str) -> None:
         """Initialize a new trace."""
-        self._traces[trace_id] = []
+        self._new_trace(trace_id)
         logger.info("trace_started", trace_id=trace_id)
 
+    def _new_trace(self, trace_id: str) -> None:
+        self._traces[trace_id] = []
+        self._traces.move_to_end(trace_id)
+        self._totals[trace_id] = _TraceTotals()
+        while len(self._traces) > self._max_traces:
+            evicted, _ = self._traces.popitem(last=False)
+            del self._totals[evicted]
+
     def log_step(
         self,
         trace_id: str,
@@ -53,9 +85,14 @@ class DecisionTracer:
         )
 
         if trace_id not in self._traces:
-            self._traces[trace_id] = []
+            self._new_trace(trace_id)
+        else:
+            self._traces.move_to_end(trace_id)
 
         self._traces[trace_id].append(step)
+        totals = self._totals[trace_id]
+        totals.tokens += tokens_used
+        totals.cost += cost_usd
 
         log_kwargs: dict[str, Any] = {
             "trace_id": trace_id,
@@ -80,43 +117,42 @@ class DecisionTracer:
                     )
                 )
 
+        callback = self._step_callbacks.get(trace_id)
+        if callback is not None:
+            # A failing observer must not abort the pipeline that is logging
+            try:
+                callback(step)
+            except Exception:
+                logger.exception("step_callback_failed", trace_id=trace_id, agent=agent_name)
+
         return step
 
+    def watch(self, trace_id: str, callback: Callable[[AgentStep], None] | None) -> None:
+        """Call ``callback`` with every step logged to a trace; None stops watching."""
+        if callback is None:
+            self._step_callbacks.pop(trace_id, None)
+        else:
+            self._step_callbacks[trace_id] = callback
+
     def get_trace(self, trace_id: str) -> list[AgentStep]:
         """Get all steps for a trace in order."""
         return self._traces.get(trace_id, [])
 
     def get_total_tokens(self, trace_id: str) -> int:
-        """Sum all tokens used across a trace."""
-        return sum(step.tokens_used for step in self.get_trace(trace_id))
+        """Return the total tokens used across a trace."""
+        totals = self._totals.get(trace_id)
+        return totals.tokens if totals is not None else 0
 
     def get_total_cost(self, trace_id: str) -> float:
-        """Sum all costs across a trace."""
-        return sum(step.cost_usd for step in self.get_trace(trace_id))
+        """Return the total cost across a trace."""
+        totals = self._totals.get(trace_id)
+        return totals.cost if totals is not None else 0.0
 
     def export_trace_json(self, trace_id: str) -> str:
         """Export the full trace as a JSON string for dashboard consumption."""
-        steps = self.get_trace(trace_id)
-        data: list[dict[str, Any]] = []
-        for step in steps:
-            data.append({
-                "agent_name": step.agent_name,
-                "action": step.action,
-                "reasoning": step.reasoning,
-                "tool_calls": [
-                    {
-                        "tool_name": tc.tool_name,
-                        "arguments": tc.arguments,
-                        "latency_ms": tc.latency_ms,
-                        "result": tc.result,
-                    }
-                    for tc in step.tool_calls
-                ],
-                "tokens_used": step.tokens_used,
-                "cost_usd": step.cost_usd,
-                "timestamp": step.timestamp.isoformat(),
-            })
-        return json.dumps(data, indent=2, default=str)
+        # orjson formats the datetimes itself, identically to isoformat() but faster
+        data = [_step_as_dict(step, iso_timestamp=False) for step in self.get_trace(trace_id)]
+        return orjson.dumps(data, default=str, option=_EXPORT_OPTIONS).decode()
 
     def export_trace_for_dashboard(self, trace_id: str) -> dict[str, Any]:
         """Export a richer trace structure with per-agent summaries.
@@ -126,23 +162,19 @@ class DecisionTracer:
         """
         steps = self.get_trace(trace_id)
 
-        agent_summaries: dict[str, dict[str, Any]] = {}
+        # Overall totals are kept by log_step; one pass builds the per-agent
+        # summaries and step dicts together
+        agent_summaries: defaultdict[str, dict[str, Any]] = defaultdict(_new_agent_summary)
+        step_dicts: list[dict[str, Any]] = []
         for step in steps:
-            name = step.agent_name
-            if name not in agent_summaries:
-                agent_summaries[name] = {
-                    "total_tokens": 0,
-                    "total_cost": 0.0,
-                    "tool_call_count": 0,
-                    "steps": 0,
-                }
-            summary = agent_summaries[name]
+            summary = agent_summaries[step.agent_name]
             summary["total_tokens"] += step.tokens_used
             summary["total_cost"] += step.cost_usd
             summary["tool_call_count"] += len(step.tool_calls)
             summary["steps"] += 1
+            step_dicts.append(_step_as_dict(step))
 
-        # Round cost values
+        # Round once per agent, after summing
         for summary in agent_summaries.values():
             summary["total_cost"] = round(summary["total_cost"], 6)
 
@@ -151,6 +183,34 @@ class DecisionTracer:
             "total_tokens": self.get_total_tokens(trace_id),
             "total_cost": round(self.get_total_cost(trace_id), 6),
             "total_steps": len(steps),
-            "agents": agent_summaries,
-            "steps": json.loads(self.export_trace_json(trace_id)),
+            "agents": dict(agent_summaries),
+            "steps": step_dicts,
         }
+
+
+def _new_agent_summary() -> dict[str, Any]:
+    return {"total_tokens": 0, "total_cost": 0.0, "tool_call_count": 0, "steps": 0}
+
+
+def _step_as_dict(step: AgentStep, *, iso_timestamp: bool = True) -> dict[str, Any]:
+    """Plain-dict view of a step, shared by the JSON and dashboard exports.
+
+    With ``iso_timestamp=False`` the timestamp is left as a datetime for orjson.
+    """
+    return {
+        "agent_name": step.agent_name,
+        "action": step.action,
+        "reasoning": step.reasoning,
+        "tool_calls": [
+            {
+                "tool_name": tc.tool_name,
+                "arguments": tc.arguments,
+                "latency_ms": tc.latency_ms,
+                "result": tc.result,
+            }
+            for tc in step.tool_calls
+        ],
+        "tokens_used": step.tokens_used,
+        "cost_usd": step.cost_usd,
+        "timestamp": step.timestamp.isoformat() if iso_timestamp else step.timestamp,
+    }
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import uuid
+import secrets
+import threading
+from collections import OrderedDict
 from typing import Any, Literal
 
 import structlog
@@ -15,8 +17,16 @@ logger = structlog.get_logger()
 class MessageBus:
     """In-process message bus for agent-to-agent communication."""
 
-    def __init__(self) -> None:
-        self._messages: list[AgentMessage] = []
+    def __init__(self, max_traces: int = 1000) -> None:
+        # Messages per trace, and per recipient within a trace, in send order.
+        # Traces are kept least recently written first; beyond max_traces the
+        # oldest is dropped from both indexes.
+        self._by_trace: OrderedDict[str, list[AgentMessage]] = OrderedDict()
+        self._by_trace_agent: dict[str, dict[str, list[AgentMessage]]] = {}
+        self._max_traces = max_traces
+        # send() may be called from the MCP server and analyzer threads at once;
+        # the lock keeps both indexes in step and readers see consistent snapshots
+        self._lock = threading.Lock()
 
     def send(
         self,
@@ -34,7 +44,18 @@ class MessageBus:
             content=content,
             trace_id=trace_id,
         )
-        self._messages.append(msg)
+        with self._lock:
+            messages = self._by_trace.get(trace_id)
+            if messages is None:
+                messages = self._by_trace[trace_id] = []
+                self._by_trace_agent[trace_id] = {}
+                while len(self._by_trace) > self._max_traces:
+                    evicted, _ = self._by_trace.popitem(last=False)
+                    del self._by_trace_agent[evicted]
+            else:
+                self._by_trace.move_to_end(trace_id)
+            messages.append(msg)
+            self._by_trace_agent[trace_id].setdefault(to_agent, []).append(msg)
 
         logger.info(
             "a2a_message",
@@ -48,16 +69,15 @@ class MessageBus:
 
     def get_messages(self, trace_id: str) -> list[AgentMessage]:
         """Get all messages for a given trace."""
-        return [m for m in self._messages if m.trace_id == trace_id]
+        with self._lock:
+            return list(self._by_trace.get(trace_id, ()))
 
     def get_messages_for_agent(self, agent_name: str, trace_id: str) -> list[AgentMessage]:
         """Get all messages sent to a specific agent for a trace."""
-        return [
-            m for m in self._messages
-            if m.to_agent == agent_name and m.trace_id == trace_id
-        ]
+        with self._lock:
+            return list(self._by_trace_agent.get(trace_id, {}).get(agent_name, ()))
 
 
 def new_trace_id() -> str:
     """Generate a unique trace ID for correlating agent messages."""
-    return f"trace-{uuid.uuid4().hex[:12]}"
+    return f"trace-{secrets.token_hex(6)}"
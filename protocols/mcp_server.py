@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import os
 import sys
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 # Ensure project root is on the path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+import orjson
 from mcp.server.fastmcp import FastMCP
 
 from agent.core import IncidentAnalyzer
@@ -21,36 +21,51 @@ from rag.engine import RAGEngine
 from rag.ingest import COLLECTION_NAME, ingest_runbooks
 from tools.metrics import get_metrics
 
+if TYPE_CHECKING:
+    from chromadb.api import ClientAPI
+
 # Initialize the MCP server
 mcp = FastMCP(
     "Sentinel",
     instructions="AI-powered production incident analysis system",
 )
 
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response as indented JSON text."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
 # Lazy-initialized singletons
 _rag_engine: RAGEngine | None = None
 _analyzer: IncidentAnalyzer | None = None
+# Set once the runbook collection is known to be populated
+_runbooks_ready = False
 
 
-def _ensure_runbooks() -> None:
+def _ensure_runbooks(client: ClientAPI) -> None:
     """Ingest runbooks if not already done."""
-    import chromadb
-
-    persist_dir = os.environ.get("CHROMA_PERSIST_DIR", "./chroma_data")
-    client = chromadb.PersistentClient(path=persist_dir)
+    global _runbooks_ready
+    if _runbooks_ready:
+        return
     try:
         collection = client.get_collection(COLLECTION_NAME)
         if collection.count() == 0:
             raise ValueError("empty")
     except Exception:
         ingest_runbooks()
+    _runbooks_ready = True
 
 
 def _get_rag_engine() -> RAGEngine:
     global _rag_engine
     if _rag_engine is None:
-        _ensure_runbooks()
-        _rag_engine = RAGEngine()
+        import chromadb
+
+        persist_dir = os.environ.get("CHROMA_PERSIST_DIR", "./chroma_data")
+        client = chromadb.PersistentClient(path=persist_dir)
+        _ensure_runbooks(client)
+        _rag_engine = RAGEngine(client=client)
     return _rag_engine
 
 
@@ -95,7 +110,7 @@ async def analyze_incident(
 
     report = await analyzer.analyze(alert)
 
-    return json.dumps(
+    return _dumps(
         {
             "incident_id": report.incident_id,
             "summary": report.summary,
@@ -106,8 +121,7 @@ async def analyze_incident(
             "duration_seconds": report.duration_seconds,
             "total_tokens": report.total_tokens,
             "total_cost_usd": report.total_cost_usd,
-        },
-        indent=2,
+        }
     )
 
 
@@ -135,7 +149,7 @@ async def search_runbooks(query: str) -> str:
             "content": r.content,
         })
 
-    return json.dumps(output, indent=2)
+    return _dumps(output)
 
 
 @mcp.tool()
@@ -151,16 +165,17 @@ async def get_service_health(service: str) -> str:
     metrics = await get_metrics(service=service)
 
     if not metrics:
-        return json.dumps({"error": f"No metrics found for service '{service}'"})
+        return orjson.dumps({"error": f"No metrics found for service '{service}'"}).decode()
 
     # Group by metric name, take the latest value
     latest: dict[str, dict[str, Any]] = {}
     for m in metrics:
         name = m["metric_name"]
-        if name not in latest or m["timestamp"] > latest[name]["timestamp"]:
+        current = latest.get(name)
+        if current is None or m["timestamp"] > current["timestamp"]:
             latest[name] = m
 
-    return json.dumps(
+    return _dumps(
         {
             "service": service,
             "metrics": [
@@ -172,8 +187,7 @@ async def get_service_health(service: str) -> str:
                 }
                 for v in latest.values()
             ],
-        },
-        indent=2,
+        }
     )
 
 
@@ -198,9 +212,8 @@ async def list_runbooks() -> str:
         return "No runbooks directory found"
 
     files = sorted(runbook_dir.glob("*.md"))
-    return json.dumps(
-        [{"filename": f.name, "title": f.stem.replace("-", " ").title()} for f in files],
-        indent=2,
+    return _dumps(
+        [{"filename": f.name, "title": f.stem.replace("-", " ").title()} for f in files]
     )
 
 
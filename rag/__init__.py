@@ -1 +1,4 @@
 """RAG engine — ChromaDB vector store with sentence-transformer embeddings."""
+
+# Written into the Chroma directory once ingest_runbooks has stored every runbook
+INGEST_MARKER = ".sentinel_ingested"
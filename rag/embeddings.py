@@ -2,22 +2,81 @@
 
 from __future__ import annotations
 
+import asyncio
+import weakref
+from typing import TYPE_CHECKING
+
 from sentence_transformers import SentenceTransformer
 
+if TYPE_CHECKING:
+    import numpy as np
+
 _MODEL_NAME = "all-MiniLM-L6-v2"
 _instance: EmbeddingModel | None = None
 
+# Concurrent embed_one calls arriving within this window share one encode() call
+_BATCH_WINDOW_SECONDS = 0.005
+_MAX_BATCH_SIZE = 32
+
+_Pending = list[tuple[str, "asyncio.Future[np.ndarray]"]]
+
 
 class EmbeddingModel:
     """Wraps sentence-transformers to generate text embeddings."""
 
     def __init__(self, model_name: str = _MODEL_NAME) -> None:
         self._model = SentenceTransformer(model_name)
+        # Queued embed_one requests, per event loop (the singleton may outlive a loop)
+        self._pending: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Pending] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings for a list of texts, one row per text.
+
+        Vectors stay as a float32 array; ChromaDB accepts them without a
+        conversion to Python lists.
+        """
+        return self._model.encode(texts, show_progress_bar=False, convert_to_numpy=True)
+
+    async def embed_one(self, text: str) -> np.ndarray:
+        """Embed a single text, coalescing concurrent callers into one batch.
+
+        The first request opens a short batching window; requests arriving
+        before it closes (or until the batch is full) are encoded together
+        in a worker thread, off the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[np.ndarray] = loop.create_future()
+        pending = self._pending.setdefault(loop, [])
+        pending.append((text, future))
+        if len(pending) == 1:
+            loop.call_later(_BATCH_WINDOW_SECONDS, self._schedule_flush, loop, pending)
+        elif len(pending) >= _MAX_BATCH_SIZE:
+            self._schedule_flush(loop, pending)
+        return await future
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop, pending: _Pending) -> None:
+        # The window timer and a full batch can both fire for the same list
+        if self._pending.get(loop) is pending:
+            del self._pending[loop]
+            task = loop.create_task(self._flush(pending))
+            # Hold a reference until done so the task is not garbage-collected
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
 
-    def embed(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings for a list of texts."""
-        embeddings = self._model.encode(texts, show_progress_bar=False)
-        return [e.tolist() for e in embeddings]
+    async def _flush(self, pending: _Pending) -> None:
+        try:
+            vectors = await asyncio.to_thread(self.embed, [text for text, _ in pending])
+        except Exception as exc:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), vector in zip(pending, vectors):
+            if not future.done():
+                future.set_result(vector)
 
 
 def get_embedding_model() -> EmbeddingModel:
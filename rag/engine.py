@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import os
+from dataclasses import dataclass
 from typing import Literal
 
 import chromadb
+import numpy as np
 import structlog
+from chromadb.api import ClientAPI
 from chromadb.api.models.Collection import Collection
-from pydantic import BaseModel, Field
 
 from rag.embeddings import get_embedding_model
 from rag.ingest import COLLECTION_NAME
@@ -16,31 +18,46 @@ from rag.ingest import COLLECTION_NAME
 logger = structlog.get_logger()
 
 
-class RAGResult(BaseModel):
-    """A single search result from the runbook vector store."""
+@dataclass(frozen=True, slots=True)
+class RAGResult:
+    """A single search result from the runbook vector store.
+
+    Built only by RAGEngine.search from ChromaDB output, so fields are not
+    re-validated; similarity_score is a cosine similarity in [0, 1].
+    """
 
     content: str
     source_file: str
     title: str
-    similarity_score: float = Field(ge=0.0, le=1.0)
+    similarity_score: float
     chunk_index: int
     confidence: Literal["high", "medium", "low"]
 
 
-def _classify_confidence(score: float) -> Literal["high", "medium", "low"]:
-    if score > 0.7:
-        return "high"
-    elif score >= 0.4:
-        return "medium"
-    return "low"
+_CONFIDENCE_LEVELS: tuple[Literal["low", "medium", "high"], ...] = ("low", "medium", "high")
+
+
+def _classify_confidences(scores: np.ndarray) -> list[Literal["high", "medium", "low"]]:
+    """Bucket similarity scores: above 0.7 is high, 0.4 and up is medium, else low."""
+    levels = (scores >= 0.4).astype(np.intp) + (scores > 0.7)
+    return [_CONFIDENCE_LEVELS[level] for level in levels.tolist()]
 
 
 class RAGEngine:
     """Search engine over operational runbooks stored in ChromaDB."""
 
-    def __init__(self, chroma_persist_dir: str | None = None) -> None:
-        persist_dir = chroma_persist_dir or os.environ.get("CHROMA_PERSIST_DIR", "./chroma_data")
-        self._client = chromadb.PersistentClient(path=persist_dir)
+    def __init__(
+        self,
+        chroma_persist_dir: str | None = None,
+        client: ClientAPI | None = None,
+    ) -> None:
+        """Open the runbook collection, reusing ``client`` when the caller already has one."""
+        if client is None:
+            persist_dir = chroma_persist_dir or os.environ.get(
+                "CHROMA_PERSIST_DIR", "./chroma_data"
+            )
+            client = chromadb.PersistentClient(path=persist_dir)
+        self._client = client
         self._embedding_model = get_embedding_model()
         self._collection: Collection | None = None
         try:
@@ -54,35 +71,36 @@ class RAGEngine:
             logger.warning("rag_search_empty_collection", query=query)
             return []
 
-        query_embedding = self._embedding_model.embed([query])[0]
+        query_embedding = await self._embedding_model.embed_one(query)
 
         results = self._collection.query(
-            query_embeddings=[query_embedding],  # type: ignore[arg-type]
+            query_embeddings=[query_embedding],
             n_results=min(top_k, self._collection.count()),
             include=["documents", "metadatas", "distances"],
         )
 
-        rag_results: list[RAGResult] = []
         documents = results["documents"][0] if results["documents"] else []
         metadatas = results["metadatas"][0] if results["metadatas"] else []
         distances = results["distances"][0] if results["distances"] else []
 
-        for doc, meta, distance in zip(documents, metadatas, distances):
-            # ChromaDB cosine distance: 0 = identical, 2 = opposite
-            # Convert to similarity: 1 - (distance / 2)
-            similarity = 1.0 - (distance / 2.0)
-            confidence = _classify_confidence(similarity)
-
-            rag_results.append(
-                RAGResult(
-                    content=doc,
-                    source_file=str(meta["source_file"]),
-                    title=str(meta["title"]),
-                    similarity_score=round(similarity, 4),
-                    chunk_index=int(meta["chunk_index"]),  # type: ignore[arg-type]
-                    confidence=confidence,
-                )
+        # ChromaDB cosine distance: 0 = identical, 2 = opposite
+        # Convert to similarity: 1 - (distance / 2)
+        similarities = 1.0 - np.asarray(distances, dtype=np.float64) / 2.0
+        confidences = _classify_confidences(similarities)
+
+        rag_results = [
+            RAGResult(
+                content=doc,
+                source_file=str(meta["source_file"]),
+                title=str(meta["title"]),
+                similarity_score=similarity,
+                chunk_index=int(meta["chunk_index"]),  # type: ignore[arg-type]
+                confidence=confidence,
+            )
+            for doc, meta, similarity, confidence in zip(
+                documents, metadatas, np.round(similarities, 4).tolist(), confidences
             )
+        ]
 
         top_score = rag_results[0].similarity_score if rag_results else 0.0
         logger.info(
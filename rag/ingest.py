@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from pathlib import Path
 
 import chromadb
 
+from rag import INGEST_MARKER
 from rag.embeddings import get_embedding_model
 
 CHUNK_SIZE = 512
 CHUNK_OVERLAP = 50
+READ_WORKERS = 8
 COLLECTION_NAME = "runbooks"
 
 
@@ -24,15 +28,10 @@ def _extract_title(content: str) -> str:
 
 def _chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> list[str]:
     """Split text into overlapping chunks of approximately chunk_size characters."""
-    chunks: list[str] = []
-    start = 0
-    while start < len(text):
-        end = start + chunk_size
-        chunk = text[start:end]
-        if chunk.strip():
-            chunks.append(chunk.strip())
-        start = end - overlap
-    return chunks
+    # Window starts are known up front; each window is sliced and stripped once
+    starts = range(0, len(text), chunk_size - overlap)
+    windows = (text[start:start + chunk_size] for start in starts)
+    return [chunk for chunk in map(str.strip, windows) if chunk]
 
 
 def ingest_runbooks(
@@ -54,31 +53,10 @@ def ingest_runbooks(
 
     print(f"Found {len(md_files)} runbook files")
 
-    all_chunks: list[str] = []
-    all_metadatas: list[dict[str, str | int]] = []
-    all_ids: list[str] = []
-
-    for md_file in md_files:
-        content = md_file.read_text(encoding="utf-8")
-        title = _extract_title(content)
-        chunks = _chunk_text(content)
-
-        for i, chunk in enumerate(chunks):
-            all_chunks.append(chunk)
-            all_metadatas.append({
-                "source_file": md_file.name,
-                "title": title,
-                "chunk_index": i,
-            })
-            all_ids.append(f"{md_file.stem}__chunk_{i}")
-
-    print(f"Created {len(all_chunks)} chunks from {len(md_files)} documents")
-
-    print("Generating embeddings...")
     model = get_embedding_model()
-    embeddings = model.embed(all_chunks)
-
     client = chromadb.PersistentClient(path=chroma_persist_dir)
+    # Cleared first so an interrupted re-ingest does not look complete
+    Path(chroma_persist_dir, INGEST_MARKER).unlink(missing_ok=True)
     try:
         client.delete_collection(COLLECTION_NAME)
     except Exception:
@@ -89,16 +67,38 @@ def ingest_runbooks(
         metadata={"hnsw:space": "cosine"},
     )
 
-    collection.add(
-        ids=all_ids,
-        documents=all_chunks,
-        embeddings=embeddings,  # type: ignore[arg-type]
-        metadatas=all_metadatas,  # type: ignore[arg-type]
-    )
-
+    # Files are read ahead on a thread pool; chunks and embeddings are built
+    # and stored one file at a time, so only raw text is held corpus-wide
+    print("Generating embeddings...")
+    total_chunks = 0
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        contents = pool.map(lambda path: path.read_text(encoding="utf-8"), md_files)
+        for md_file, content in zip(md_files, contents):
+            title = _extract_title(content)
+            chunks = _chunk_text(content)
+            if not chunks:
+                continue
+
+            collection.add(
+                ids=[f"{md_file.stem}__chunk_{i}" for i in range(len(chunks))],
+                documents=chunks,
+                embeddings=model.embed(chunks),
+                metadatas=[
+                    {"source_file": md_file.name, "title": title, "chunk_index": i}
+                    for i in range(len(chunks))
+                ],
+            )
+            total_chunks += len(chunks)
+
+    print(f"Created {total_chunks} chunks from {len(md_files)} documents")
     print(f"Stored {collection.count()} chunks in ChromaDB collection '{COLLECTION_NAME}'")
     print(f"Persist directory: {chroma_persist_dir}")
 
+    # Lets callers confirm ingestion with one stat instead of opening the collection
+    Path(chroma_persist_dir, INGEST_MARKER).write_text(
+        datetime.now(UTC).isoformat(), encoding="utf-8"
+    )
+
 
 if __name__ == "__main__":
     ingest_runbooks()
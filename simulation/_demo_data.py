@@ -0,0 +1,259 @@
+"""Pre-scripted LLM responses for the demo, used when no API key is available.
+
+Kept out of run_demo so the payloads are only built when the scripted path runs.
+"""
+
+from __future__ import annotations
+
+import json
+
+from agent.llm_client import Response, TokenUsage
+
+# Payloads exist only as their serialized JSON; the source dicts are not kept
+_TRIAGE_JSON = json.dumps({
+    "classification": "resource-exhaustion",
+    "affected_services": ["payment-api", "order-service"],
+    "priority": "P1",
+    "summary": (
+        "Payment-api experiencing database connection pool "
+        "exhaustion causing P99 latency spike to 2100ms and "
+        "15% error rate. Cascading impact on downstream "
+        "order-service detected."
+    ),
+    "delegation_instructions": (
+        "Investigate payment-api ERROR logs for database "
+        "timeout patterns. Check recent deployments within "
+        "the last 60 minutes for configuration changes. "
+        "Query db_connection_pool metrics for utilization "
+        "trend. Search runbooks for connection pool "
+        "exhaustion remediation procedures."
+    ),
+})
+
+_RESEARCH_JSON = json.dumps({
+    "timeline": [
+        {
+            "timestamp": "2024-01-15T14:00:00Z",
+            "event": (
+                "Deployment a1bf3d2 applied to "
+                "payment-api by sarah.chen"
+            ),
+        },
+        {
+            "timestamp": "2024-01-15T14:15:00Z",
+            "event": (
+                "DB connection pool utilization "
+                "begins climbing (30% to 75%)"
+            ),
+        },
+        {
+            "timestamp": "2024-01-15T14:25:00Z",
+            "event": (
+                "First SQLSTATE 08006 timeout errors "
+                "appear in payment-api logs"
+            ),
+        },
+        {
+            "timestamp": "2024-01-15T14:28:00Z",
+            "event": (
+                "Connection pool reaches 98% capacity "
+                "— new connections queueing"
+            ),
+        },
+        {
+            "timestamp": "2024-01-15T14:30:00Z",
+            "event": (
+                "P99 latency spikes to 2100ms, "
+                "error rate reaches 15%"
+            ),
+        },
+    ],
+    "root_cause": (
+        "Deployment a1bf3d2 by sarah.chen at 14:00 UTC "
+        "modified the database connection pool configuration, "
+        "reducing max_connections from 50 to 10. Under normal "
+        "traffic load, the reduced pool was exhausted within "
+        "30 minutes, causing connection timeouts (SQLSTATE "
+        "08006) and cascading latency spikes across "
+        "payment-api and downstream order-service."
+    ),
+    "confidence": 0.95,
+    "evidence": [
+        (
+            "Deployment a1bf3d2 at 14:00 UTC is the only "
+            "change in the 2-hour window before the incident"
+        ),
+        (
+            "DB connection pool utilization jumped from "
+            "30% to 98% starting 15 minutes post-deploy"
+        ),
+        (
+            "47 SQLSTATE 08006 connection timeout errors "
+            "logged between 14:25 and 14:30"
+        ),
+        (
+            "Latency increase directly correlates with "
+            "pool utilization increase"
+        ),
+        (
+            "Runbook 'Database Connection Pool Exhaustion' "
+            "matches all observed symptoms"
+        ),
+    ],
+    "relevant_runbooks": [
+        "Database Connection Pool Exhaustion",
+        "High Latency Troubleshooting",
+    ],
+    "affected_services": ["payment-api", "order-service"],
+})
+
+_REMEDIATION_JSON = json.dumps({
+    "remediation_steps": [
+        {
+            "step": 1,
+            "action": (
+                "Roll back deployment a1bf3d2 to "
+                "previous stable revision"
+            ),
+            "risk": "high",
+            "requires_approval": True,
+            "rationale": (
+                "Deployment a1bf3d2 directly caused pool "
+                "exhaustion by misconfiguring max_connections. "
+                "Rollback restores the working configuration."
+            ),
+            "runbook_reference": "Emergency Deployment Rollback",
+        },
+        {
+            "step": 2,
+            "action": (
+                "Monitor db_connection_pool metric — "
+                "verify utilization drops below 40% "
+                "within 10 minutes"
+            ),
+            "risk": "low",
+            "requires_approval": False,
+            "rationale": (
+                "Post-rollback, existing connections will "
+                "drain and pool utilization should normalize. "
+                "If not recovered in 10 minutes, escalate."
+            ),
+        },
+        {
+            "step": 3,
+            "action": (
+                "Add Prometheus alert for "
+                "db_connection_pool > 80% utilization"
+            ),
+            "risk": "low",
+            "requires_approval": False,
+            "rationale": (
+                "No existing alert caught the pool climbing "
+                "from 30% to 98%. A threshold at 80% would "
+                "provide 10-15 minutes of early warning."
+            ),
+        },
+    ],
+    "requires_human_approval": True,
+    "summary": (
+        "Immediate rollback of deployment a1bf3d2 required "
+        "to restore database connection pool settings. "
+        "Post-rollback monitoring to verify recovery, "
+        "followed by adding preventive alerting."
+    ),
+})
+
+
+def build_demo_responses() -> list[Response]:
+    """Build pre-scripted LLM responses for an impressive demo.
+
+    Returns 5 responses in order:
+      1. Triage classification (no tool calls)
+      2. Research tool calls (search_logs, deployments, metrics, runbooks)
+      3. Research final findings
+      4. Remediation tool call (search_runbooks)
+      5. Remediation final proposal
+    """
+    model = "claude-sonnet-4-5-20250929"
+
+    return [
+        # 1. Triage — classify the alert
+        Response(
+            content=_TRIAGE_JSON,
+            usage=TokenUsage(input_tokens=650, output_tokens=280),
+            model=model,
+            stop_reason="end_turn",
+        ),
+        # 2. Research — call 4 tools to investigate
+        Response(
+            content="",
+            usage=TokenUsage(input_tokens=1200, output_tokens=180),
+            model=model,
+            stop_reason="tool_use",
+            tool_calls=[
+                {
+                    "id": "toolu_01logs",
+                    "name": "search_logs",
+                    "input": {
+                        "service": "payment-api",
+                        "severity": "ERROR",
+                    },
+                },
+                {
+                    "id": "toolu_02deploys",
+                    "name": "get_recent_deployments",
+                    "input": {"service": "payment-api"},
+                },
+                {
+                    "id": "toolu_03metrics",
+                    "name": "get_metrics",
+                    "input": {
+                        "service": "payment-api",
+                        "metric_name": "db_connection_pool",
+                    },
+                },
+                {
+                    "id": "toolu_04runbooks",
+                    "name": "search_runbooks",
+                    "input": {
+                        "query": (
+                            "database connection pool exhaustion"
+                        ),
+                    },
+                },
+            ],
+        ),
+        # 3. Research — final analysis after reviewing tool results
+        Response(
+            content=_RESEARCH_JSON,
+            usage=TokenUsage(input_tokens=2800, output_tokens=520),
+            model=model,
+            stop_reason="end_turn",
+        ),
+        # 4. Remediation — search runbooks for rollback procedure
+        Response(
+            content="",
+            usage=TokenUsage(input_tokens=1500, output_tokens=120),
+            model=model,
+            stop_reason="tool_use",
+            tool_calls=[
+                {
+                    "id": "toolu_05runbooks",
+                    "name": "search_runbooks",
+                    "input": {
+                        "query": (
+                            "emergency deployment rollback "
+                            "procedure"
+                        ),
+                    },
+                },
+            ],
+        ),
+        # 5. Remediation — final proposal with steps
+        Response(
+            content=_REMEDIATION_JSON,
+            usage=TokenUsage(input_tokens=1800, output_tokens=380),
+            model=model,
+            stop_reason="end_turn",
+        ),
+    ]
@@ -1,280 +1,37 @@
-"""Demo script — runs a full incident analysis on a sample payment-api alert."""
+"""Demo script — runs a full incident analysis on a sample payment-api alert.
+
+Set SENTINEL_DEMO_ALERTS to a comma-separated list of evaluation scenario names
+(e.g. ``cpu_spike,memory_leak``) to analyze those alerts concurrently instead.
+"""
 
 from __future__ import annotations
 
 import asyncio
-import json
+import io
 import os
 import sys
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
 
 # Ensure project root is on the path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+import orjson
+
 from agent.core import IncidentAnalyzer
 from agent.llm_client import (
+    CachingClient,
+    LLMClient,
     MockClient,
-    Response,
-    TokenUsage,
     create_client,
 )
-from agent.models import Alert
-from rag.engine import RAGEngine
-from rag.ingest import ingest_runbooks
-
-# ---------------------------------------------------------------------------
-# Pre-scripted demo responses (used when no API key is available)
-# ---------------------------------------------------------------------------
-
-_TRIAGE_RESULT = {
-    "classification": "resource-exhaustion",
-    "affected_services": ["payment-api", "order-service"],
-    "priority": "P1",
-    "summary": (
-        "Payment-api experiencing database connection pool "
-        "exhaustion causing P99 latency spike to 2100ms and "
-        "15% error rate. Cascading impact on downstream "
-        "order-service detected."
-    ),
-    "delegation_instructions": (
-        "Investigate payment-api ERROR logs for database "
-        "timeout patterns. Check recent deployments within "
-        "the last 60 minutes for configuration changes. "
-        "Query db_connection_pool metrics for utilization "
-        "trend. Search runbooks for connection pool "
-        "exhaustion remediation procedures."
-    ),
-}
-
-_RESEARCH_RESULT = {
-    "timeline": [
-        {
-            "timestamp": "2024-01-15T14:00:00Z",
-            "event": (
-                "Deployment a1bf3d2 applied to "
-                "payment-api by sarah.chen"
-            ),
-        },
-        {
-            "timestamp": "2024-01-15T14:15:00Z",
-            "event": (
-                "DB connection pool utilization "
-                "begins climbing (30% to 75%)"
-            ),
-        },
-        {
-            "timestamp": "2024-01-15T14:25:00Z",
-            "event": (
-                "First SQLSTATE 08006 timeout errors "
-                "appear in payment-api logs"
-            ),
-        },
-        {
-            "timestamp": "2024-01-15T14:28:00Z",
-            "event": (
-                "Connection pool reaches 98% capacity "
-                "— new connections queueing"
-            ),
-        },
-        {
-            "timestamp": "2024-01-15T14:30:00Z",
-            "event": (
-                "P99 latency spikes to 2100ms, "
-                "error rate reaches 15%"
-            ),
-        },
-    ],
-    "root_cause": (
-        "Deployment a1bf3d2 by sarah.chen at 14:00 UTC "
-        "modified the database connection pool configuration, "
-        "reducing max_connections from 50 to 10. Under normal "
-        "traffic load, the reduced pool was exhausted within "
-        "30 minutes, causing connection timeouts (SQLSTATE "
-        "08006) and cascading latency spikes across "
-        "payment-api and downstream order-service."
-    ),
-    "confidence": 0.95,
-    "evidence": [
-        (
-            "Deployment a1bf3d2 at 14:00 UTC is the only "
-            "change in the 2-hour window before the incident"
-        ),
-        (
-            "DB connection pool utilization jumped from "
-            "30% to 98% starting 15 minutes post-deploy"
-        ),
-        (
-            "47 SQLSTATE 08006 connection timeout errors "
-            "logged between 14:25 and 14:30"
-        ),
-        (
-            "Latency increase directly correlates with "
-            "pool utilization increase"
-        ),
-        (
-            "Runbook 'Database Connection Pool Exhaustion' "
-            "matches all observed symptoms"
-        ),
-    ],
-    "relevant_runbooks": [
-        "Database Connection Pool Exhaustion",
-        "High Latency Troubleshooting",
-    ],
-    "affected_services": ["payment-api", "order-service"],
-}
-
-_REMEDIATION_RESULT = {
-    "remediation_steps": [
-        {
-            "step": 1,
-            "action": (
-                "Roll back deployment a1bf3d2 to "
-                "previous stable revision"
-            ),
-            "risk": "high",
-            "requires_approval": True,
-            "rationale": (
-                "Deployment a1bf3d2 directly caused pool "
-                "exhaustion by misconfiguring max_connections. "
-                "Rollback restores the working configuration."
-            ),
-            "runbook_reference": "Emergency Deployment Rollback",
-        },
-        {
-            "step": 2,
-            "action": (
-                "Monitor db_connection_pool metric — "
-                "verify utilization drops below 40% "
-                "within 10 minutes"
-            ),
-            "risk": "low",
-            "requires_approval": False,
-            "rationale": (
-                "Post-rollback, existing connections will "
-                "drain and pool utilization should normalize. "
-                "If not recovered in 10 minutes, escalate."
-            ),
-        },
-        {
-            "step": 3,
-            "action": (
-                "Add Prometheus alert for "
-                "db_connection_pool > 80% utilization"
-            ),
-            "risk": "low",
-            "requires_approval": False,
-            "rationale": (
-                "No existing alert caught the pool climbing "
-                "from 30% to 98%. A threshold at 80% would "
-                "provide 10-15 minutes of early warning."
-            ),
-        },
-    ],
-    "requires_human_approval": True,
-    "summary": (
-        "Immediate rollback of deployment a1bf3d2 required "
-        "to restore database connection pool settings. "
-        "Post-rollback monitoring to verify recovery, "
-        "followed by adding preventive alerting."
-    ),
-}
-
-
-def _build_demo_responses() -> list[Response]:
-    """Build pre-scripted LLM responses for an impressive demo.
-
-    Returns 5 responses in order:
-      1. Triage classification (no tool calls)
-      2. Research tool calls (search_logs, deployments, metrics, runbooks)
-      3. Research final findings
-      4. Remediation tool call (search_runbooks)
-      5. Remediation final proposal
-    """
-    model = "claude-sonnet-4-5-20250929"
-
-    return [
-        # 1. Triage — classify the alert
-        Response(
-            content=json.dumps(_TRIAGE_RESULT),
-            usage=TokenUsage(input_tokens=650, output_tokens=280),
-            model=model,
-            stop_reason="end_turn",
-        ),
-        # 2. Research — call 4 tools to investigate
-        Response(
-            content="",
-            usage=TokenUsage(input_tokens=1200, output_tokens=180),
-            model=model,
-            stop_reason="tool_use",
-            tool_calls=[
-                {
-                    "id": "toolu_01logs",
-                    "name": "search_logs",
-                    "input": {
-                        "service": "payment-api",
-                        "severity": "ERROR",
-                    },
-                },
-                {
-                    "id": "toolu_02deploys",
-                    "name": "get_recent_deployments",
-                    "input": {"service": "payment-api"},
-                },
-                {
-                    "id": "toolu_03metrics",
-                    "name": "get_metrics",
-                    "input": {
-                        "service": "payment-api",
-                        "metric_name": "db_connection_pool",
-                    },
-                },
-                {
-                    "id": "toolu_04runbooks",
-                    "name": "search_runbooks",
-                    "input": {
-                        "query": (
-                            "database connection pool exhaustion"
-                        ),
-                    },
-                },
-            ],
-        ),
-        # 3. Research — final analysis after reviewing tool results
-        Response(
-            content=json.dumps(_RESEARCH_RESULT),
-            usage=TokenUsage(input_tokens=2800, output_tokens=520),
-            model=model,
-            stop_reason="end_turn",
-        ),
-        # 4. Remediation — search runbooks for rollback procedure
-        Response(
-            content="",
-            usage=TokenUsage(input_tokens=1500, output_tokens=120),
-            model=model,
-            stop_reason="tool_use",
-            tool_calls=[
-                {
-                    "id": "toolu_05runbooks",
-                    "name": "search_runbooks",
-                    "input": {
-                        "query": (
-                            "emergency deployment rollback "
-                            "procedure"
-                        ),
-                    },
-                },
-            ],
-        ),
-        # 5. Remediation — final proposal with steps
-        Response(
-            content=json.dumps(_REMEDIATION_RESULT),
-            usage=TokenUsage(input_tokens=1800, output_tokens=380),
-            model=model,
-            stop_reason="end_turn",
-        ),
-    ]
+from agent.models import Alert, IncidentReport
+from rag import INGEST_MARKER
 
+if TYPE_CHECKING:
+    from rag.engine import RAGEngine
 
 # ---------------------------------------------------------------------------
 # Demo runner
@@ -284,7 +41,10 @@ def _build_demo_responses() -> list[Response]:
 def ensure_runbooks_ingested() -> None:
     """Ingest runbooks if the ChromaDB collection doesn't exist yet."""
     chroma_dir = os.environ.get("CHROMA_PERSIST_DIR", "./chroma_data")
-    if not Path(chroma_dir).exists() or not any(Path(chroma_dir).iterdir()):
+    # ingest_runbooks leaves a marker file behind, so one stat answers the question
+    if not os.path.exists(os.path.join(chroma_dir, INGEST_MARKER)):
+        from rag.ingest import ingest_runbooks
+
         print("Ingesting runbooks into vector store...")
         ingest_runbooks()
         print()
@@ -292,11 +52,21 @@ def ensure_runbooks_ingested() -> None:
         print("Runbooks already ingested, skipping.\n")
 
 
-def print_section(title: str) -> None:
-    width = 70
-    print("\n" + "=" * width)
-    print(f"  {title}")
-    print("=" * width)
+_DIVIDER = "=" * 70
+
+
+def print_section(title: str, file: TextIO | None = None) -> None:
+    print(f"\n{_DIVIDER}\n  {title}\n{_DIVIDER}", file=file)
+
+
+# Live demo responses are replayed from here on later runs; set
+# SENTINEL_DEMO_CACHE to another path, or to an empty string to disable
+DEMO_CACHE_PATH = "~/.sentinel_demo_cache.json"
+
+
+def _use_live_client() -> bool:
+    provider = os.environ.get("LLM_PROVIDER", "anthropic")
+    return provider != "mock" and bool(os.environ.get("ANTHROPIC_API_KEY"))
 
 
 def _create_demo_client() -> MockClient | object:
@@ -305,18 +75,21 @@ def _create_demo_client() -> MockClient | object:
     Uses live Claude if ANTHROPIC_API_KEY is set,
     otherwise falls back to pre-scripted mock responses.
     """
-    provider = os.environ.get("LLM_PROVIDER", "anthropic")
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-
-    if provider != "mock" and api_key:
-        print("  Mode: Live Claude API")
-        return create_client()
+    if _use_live_client():
+        cache_path = os.environ.get("SENTINEL_DEMO_CACHE", DEMO_CACHE_PATH)
+        if not cache_path:
+            print("  Mode: Live Claude API")
+            return create_client()
+        print(f"  Mode: Live Claude API (responses cached in {cache_path})")
+        return CachingClient(create_client(), cache_path)
 
     print(
         "  Mode: Pre-scripted demo "
         "(set ANTHROPIC_API_KEY for live Claude)"
     )
-    return MockClient(responses=_build_demo_responses())
+    from simulation._demo_data import build_demo_responses
+
+    return MockClient(responses=build_demo_responses())
 
 
 async def run_demo() -> None:
@@ -352,6 +125,8 @@ async def run_demo() -> None:
 
     # 3. Initialize the analyzer
     llm_client = _create_demo_client()
+    from rag.engine import RAGEngine
+
     rag_engine = RAGEngine()
     analyzer = IncidentAnalyzer(
         llm_client=llm_client, rag_engine=rag_engine,
@@ -362,38 +137,42 @@ async def run_demo() -> None:
     print("  Triage Agent → Research Agent → Remediation Agent")
     print("  Processing...\n")
 
-    report = await analyzer.analyze(alert)
-
-    # 5. Print the report
-    print_section("INCIDENT REPORT")
-    print(f"  Incident ID:           {report.incident_id}")
-    print(f"  Summary:               {report.summary}")
-    print(f"  Root Cause:            {report.root_cause}")
-    print(f"  Confidence:            {report.confidence_score:.0%}")
-    print(f"  Requires Approval:     {report.requires_human_approval}")
-    print(f"  Duration:              {report.duration_seconds}s")
-    print(f"  Total Tokens:          {report.total_tokens:,}")
-    print(f"  Total Cost:            ${report.total_cost_usd:.4f}")
+    # Show each agent step as it lands rather than waiting for the full report
+    report = await analyzer.analyze(
+        alert,
+        on_step=lambda step: print(f"  [{step.agent_name}] {step.action}", flush=True),
+    )
 
-    print_section("REMEDIATION STEPS")
+    # 5. Print the report, collected first so it goes out in one write
+    out = io.StringIO()
+    print_section("INCIDENT REPORT", file=out)
+    print(f"  Incident ID:           {report.incident_id}", file=out)
+    print(f"  Summary:               {report.summary}", file=out)
+    print(f"  Root Cause:            {report.root_cause}", file=out)
+    print(f"  Confidence:            {report.confidence_score:.0%}", file=out)
+    print(f"  Requires Approval:     {report.requires_human_approval}", file=out)
+    print(f"  Duration:              {report.duration_seconds}s", file=out)
+    print(f"  Total Tokens:          {report.total_tokens:,}", file=out)
+    print(f"  Total Cost:            ${report.total_cost_usd:.4f}", file=out)
+
+    print_section("REMEDIATION STEPS", file=out)
     for i, step in enumerate(report.remediation_steps, 1):
-        print(f"  {i}. {step}")
+        print(f"  {i}. {step}", file=out)
 
-    print_section("AGENT DECISION TRACE")
+    print_section("AGENT DECISION TRACE", file=out)
+    trace_lines: list[str] = []
     for step in report.agent_trace:
         tool_info = ""
         if step.tool_calls:
-            names = [tc.tool_name for tc in step.tool_calls]
-            tool_info = f" | Tools: {', '.join(names)}"
-        print(
-            f"  [{step.agent_name}] "
-            f"{step.action}{tool_info}"
-        )
+            tool_info = f" | Tools: {', '.join(tc.tool_name for tc in step.tool_calls)}"
+        trace_lines.append(f"  [{step.agent_name}] {step.action}{tool_info}")
         if step.tokens_used:
-            print(
-                f"           Tokens: {step.tokens_used:,} "
-                f"| Cost: ${step.cost_usd:.4f}"
+            trace_lines.append(
+                f"           Tokens: {step.tokens_used:,} | Cost: ${step.cost_usd:.4f}"
             )
+    if trace_lines:
+        print("\n".join(trace_lines), file=out)
+    sys.stdout.write(out.getvalue())
 
     print_section("FULL REPORT JSON")
     report_dict = report.model_dump(mode="json")
@@ -402,12 +181,81 @@ async def run_demo() -> None:
         reasoning = step.get("reasoning", "")
         if len(reasoning) > 200:
             step["reasoning"] = reasoning[:200] + "..."
-    print(json.dumps(report_dict, indent=2, default=str))
+    # model_dump(mode="json") leaves only JSON-native values, so no default= is needed
+    sys.stdout.write(orjson.dumps(report_dict, option=orjson.OPT_INDENT_2).decode() + "\n")
 
-    print("\n" + "=" * 70)
-    print("  Demo complete.")
-    print("=" * 70)
+    print(f"\n{_DIVIDER}\n  Demo complete.\n{_DIVIDER}")
+
+
+# Analyses in flight at once in batch mode; keeps live runs inside API rate limits
+DEMO_MAX_CONCURRENCY = 4
+
+
+async def run_demo_batch(
+    alerts: Sequence[Alert],
+    llm_clients: Sequence[LLMClient],
+    rag_engine: RAGEngine | None = None,
+    max_concurrency: int = DEMO_MAX_CONCURRENCY,
+) -> list[IncidentReport]:
+    """Analyze several alerts concurrently, one LLM client per alert.
+
+    Analyzers share one RAG engine; each alert's triage → research →
+    remediation chain still runs in order, but chains for different alerts
+    overlap while they wait on the LLM.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def analyze(alert: Alert, llm_client: LLMClient) -> IncidentReport:
+        analyzer = IncidentAnalyzer(llm_client=llm_client, rag_engine=rag_engine)
+        async with semaphore:
+            return await analyzer.analyze(alert)
+
+    return list(
+        await asyncio.gather(
+            *(analyze(a, c) for a, c in zip(alerts, llm_clients, strict=True))
+        )
+    )
+
+
+async def run_scenarios_demo(names: Sequence[str]) -> None:
+    """Analyze the alerts of the named evaluation scenarios concurrently."""
+    from evaluation.scenarios import load_all_scenarios
+    from rag.engine import RAGEngine
+
+    print_section("SENTINEL — Batch Incident Analysis Demo")
+    ensure_runbooks_ingested()
+    scenarios = load_all_scenarios(names)
+
+    if _use_live_client():
+        print("  Mode: Live Claude API")
+        shared = create_client()
+        llm_clients: list[LLMClient] = [shared] * len(scenarios)
+    else:
+        print("  Mode: Pre-scripted scenario responses")
+        llm_clients = [MockClient(responses=list(s.mock_responses)) for s in scenarios]
+
+    reports = await run_demo_batch(
+        [s.alert for s in scenarios], llm_clients, rag_engine=RAGEngine(),
+    )
+
+    print_section("INCIDENT REPORTS")
+    for scenario, report in zip(scenarios, reports):
+        print(f"  [{scenario.name}] {report.incident_id} — {report.alert.service}")
+        print(f"    Root Cause:  {report.root_cause}")
+        print(
+            f"    Confidence:  {report.confidence_score:.0%} "
+            f"| Tokens: {report.total_tokens:,} "
+            f"| Cost: ${report.total_cost_usd:.4f}"
+        )
 
 
 if __name__ == "__main__":
-    asyncio.run(run_demo())
+    demo_alerts = [
+        name.strip()
+        for name in os.environ.get("SENTINEL_DEMO_ALERTS", "").split(",")
+        if name.strip()
+    ]
+    if demo_alerts:
+        asyncio.run(run_scenarios_demo(demo_alerts))
+    else:
+        asyncio.run(run_demo())
@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 import json
-from datetime import UTC, datetime
-from pathlib import Path
+from datetime import UTC, datetime, timedelta
 
 import pytest
 
@@ -19,81 +18,93 @@ from tools.registry import ToolRegistry
 # Pre-scripted LLM responses
 # ---------------------------------------------------------------------------
 
+# Payloads are serialized once at import; the Responses are session fixtures
+_TRIAGE_JSON = json.dumps({
+    "classification": "resource-exhaustion",
+    "affected_services": ["payment-api", "order-service"],
+    "priority": "P1",
+    "summary": (
+        "Payment-api experiencing connection pool "
+        "exhaustion causing cascading latency."
+    ),
+    "delegation_instructions": (
+        "Check payment-api ERROR logs for DB timeouts, check deployment history, "
+        "search runbooks for connection pool exhaustion."
+    ),
+})
 
-def _triage_response() -> Response:
+
+@pytest.fixture(scope="session")
+def triage_response() -> Response:
     return Response(
-        content=json.dumps({
-            "classification": "resource-exhaustion",
-            "affected_services": ["payment-api", "order-service"],
-            "priority": "P1",
-            "summary": (
-                "Payment-api experiencing connection pool "
-                "exhaustion causing cascading latency."
-            ),
-            "delegation_instructions": (
-                "Check payment-api ERROR logs for DB timeouts, check deployment history, "
-                "search runbooks for connection pool exhaustion."
-            ),
-        }),
+        content=_TRIAGE_JSON,
         usage=TokenUsage(input_tokens=500, output_tokens=200),
         model="mock",
         stop_reason="end_turn",
     )
 
 
-def _research_response() -> Response:
+_RESEARCH_JSON = json.dumps({
+    "timeline": [
+        {"timestamp": "2024-01-15T14:00:00Z", "event": "Deployment a1bf3d2 applied"},
+        {"timestamp": "2024-01-15T14:25:00Z", "event": "First DB timeout errors"},
+        {"timestamp": "2024-01-15T14:30:00Z", "event": "Connection pool fully exhausted"},
+    ],
+    "root_cause": (
+        "Deployment a1bf3d2 by sarah.chen changed DB connection pool settings, "
+        "causing pool exhaustion 30 minutes after deploy."
+    ),
+    "confidence": 0.92,
+    "evidence": [
+        "DB connection pool at 98% capacity",
+        "Deploy a1bf3d2 changed pool settings at 14:00",
+        "ERROR logs show SQLSTATE 08006 timeout errors starting 14:25",
+    ],
+    "relevant_runbooks": [
+        "Database Connection Pool Exhaustion",
+        "Emergency Deployment Rollback",
+    ],
+    "affected_services": ["payment-api", "order-service"],
+})
+
+
+@pytest.fixture(scope="session")
+def research_response() -> Response:
     return Response(
-        content=json.dumps({
-            "timeline": [
-                {"timestamp": "2024-01-15T14:00:00Z", "event": "Deployment a1bf3d2 applied"},
-                {"timestamp": "2024-01-15T14:25:00Z", "event": "First DB timeout errors"},
-                {"timestamp": "2024-01-15T14:30:00Z", "event": "Connection pool fully exhausted"},
-            ],
-            "root_cause": (
-                "Deployment a1bf3d2 by sarah.chen changed DB connection pool settings, "
-                "causing pool exhaustion 30 minutes after deploy."
-            ),
-            "confidence": 0.92,
-            "evidence": [
-                "DB connection pool at 98% capacity",
-                "Deploy a1bf3d2 changed pool settings at 14:00",
-                "ERROR logs show SQLSTATE 08006 timeout errors starting 14:25",
-            ],
-            "relevant_runbooks": [
-                "Database Connection Pool Exhaustion",
-                "Emergency Deployment Rollback",
-            ],
-            "affected_services": ["payment-api", "order-service"],
-        }),
+        content=_RESEARCH_JSON,
         usage=TokenUsage(input_tokens=2000, output_tokens=500),
         model="mock",
         stop_reason="end_turn",
     )
 
 
-def _remediation_response() -> Response:
+_REMEDIATION_JSON = json.dumps({
+    "remediation_steps": [
+        {
+            "step": 1,
+            "action": "Roll back deployment a1bf3d2 to previous revision",
+            "risk": "high",
+            "requires_approval": True,
+            "rationale": "Deploy directly caused pool exhaustion",
+            "runbook_reference": "Emergency Deployment Rollback",
+        },
+        {
+            "step": 2,
+            "action": "Monitor connection pool metrics for recovery",
+            "risk": "low",
+            "requires_approval": False,
+            "rationale": "Verify pool utilization returns to normal",
+        },
+    ],
+    "requires_human_approval": True,
+    "summary": "Roll back the problematic deployment and monitor for recovery.",
+})
+
+
+@pytest.fixture(scope="session")
+def remediation_response() -> Response:
     return Response(
-        content=json.dumps({
-            "remediation_steps": [
-                {
-                    "step": 1,
-                    "action": "Roll back deployment a1bf3d2 to previous revision",
-                    "risk": "high",
-                    "requires_approval": True,
-                    "rationale": "Deploy directly caused pool exhaustion",
-                    "runbook_reference": "Emergency Deployment Rollback",
-                },
-                {
-                    "step": 2,
-                    "action": "Monitor connection pool metrics for recovery",
-                    "risk": "low",
-                    "requires_approval": False,
-                    "rationale": "Verify pool utilization returns to normal",
-                },
-            ],
-            "requires_human_approval": True,
-            "summary": "Roll back the problematic deployment and monitor for recovery.",
-        }),
+        content=_REMEDIATION_JSON,
         usage=TokenUsage(input_tokens=1000, output_tokens=300),
         model="mock",
         stop_reason="end_turn",
@@ -104,6 +115,10 @@ def _remediation_response() -> Response:
 # Fixtures
 # ---------------------------------------------------------------------------
 
+# Alert time shared by the sample fixtures; datetimes are immutable, so one
+# instance serves every test
+_FIXED_TS = datetime(2024, 1, 15, 14, 30, 0, tzinfo=UTC)
+
 
 @pytest.fixture
 def sample_alert() -> Alert:
@@ -112,19 +127,21 @@ def sample_alert() -> Alert:
         service="payment-api",
         description="P99 latency spike to 2100ms, normal baseline 180ms",
         severity="critical",
-        timestamp=datetime(2024, 1, 15, 14, 30, 0, tzinfo=UTC),
+        timestamp=_FIXED_TS,
         metadata={"current_p99_ms": 2100},
     )
 
 
 @pytest.fixture
-def mock_llm_client() -> MockClient:
+def mock_llm_client(
+    triage_response: Response,
+    research_response: Response,
+    remediation_response: Response,
+) -> MockClient:
     """MockClient pre-loaded with triage → research → remediation responses."""
-    return MockClient(responses=[
-        _triage_response(),
-        _research_response(),
-        _remediation_response(),
-    ])
+    # Response is frozen, so the session objects are shared; the list is per test
+    # because MockClient tracks its position and add_response appends
+    return MockClient(responses=[triage_response, research_response, remediation_response])
 
 
 @pytest.fixture
@@ -139,9 +156,14 @@ def tool_registry() -> ToolRegistry:
     return ToolRegistry()
 
 
-@pytest.fixture
-def rag_engine(tmp_path: Path) -> RAGEngine:
-    """RAGEngine with ingested test runbooks in a temp directory."""
+@pytest.fixture(scope="session")
+def rag_engine(tmp_path_factory: pytest.TempPathFactory) -> RAGEngine:
+    """RAGEngine with ingested test runbooks in a temp directory.
+
+    Session-scoped: the runbooks never change and search does not mutate the
+    collection, so they are embedded once for the whole run.
+    """
+    tmp_path = tmp_path_factory.mktemp("rag_engine")
     runbook_dir = tmp_path / "runbooks"
     runbook_dir.mkdir()
 
@@ -205,7 +227,7 @@ def sample_report(sample_alert: Alert) -> IncidentReport:
                 tool_calls=[],
                 tokens_used=500,
                 cost_usd=0.001,
-                timestamp=datetime(2024, 1, 15, 14, 30, 1, tzinfo=UTC),
+                timestamp=_FIXED_TS + timedelta(seconds=1),
             ),
             AgentStep(
                 agent_name="research",
@@ -222,7 +244,7 @@ def sample_report(sample_alert: Alert) -> IncidentReport:
                 ],
                 tokens_used=2000,
                 cost_usd=0.005,
-                timestamp=datetime(2024, 1, 15, 14, 30, 5, tzinfo=UTC),
+                timestamp=_FIXED_TS + timedelta(seconds=5),
             ),
             AgentStep(
                 agent_name="remediation",
@@ -231,7 +253,7 @@ def sample_report(sample_alert: Alert) -> IncidentReport:
                 tool_calls=[],
                 tokens_used=1000,
                 cost_usd=0.003,
-                timestamp=datetime(2024, 1, 15, 14, 30, 8, tzinfo=UTC),
+                timestamp=_FIXED_TS + timedelta(seconds=8),
             ),
         ],
         duration_seconds=7.5,
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -12,97 +13,23 @@ from agent.agents.remediation import RemediationAgent
 from agent.agents.research import ResearchAgent
 from agent.agents.triage import TriageAgent
 from agent.core import IncidentAnalyzer
-from agent.llm_client import MockClient, Response, TokenUsage
+from agent.llm_client import (
+    AnthropicClient,
+    CachingClient,
+    MockClient,
+    Response,
+    TokenUsage,
+)
 from agent.models import Alert
 from monitoring.tracer import DecisionTracer
 from protocols.a2a import MessageBus, new_trace_id
 from tools.registry import ToolRegistry
 
 # ---------------------------------------------------------------------------
-# Helper response builders
+# Helper response builders (triage/research/remediation come from conftest)
 # ---------------------------------------------------------------------------
 
 
-def _triage_response() -> Response:
-    return Response(
-        content=json.dumps({
-            "classification": "resource-exhaustion",
-            "affected_services": ["payment-api", "order-service"],
-            "priority": "P1",
-            "summary": (
-                "Payment-api experiencing connection pool "
-                "exhaustion causing cascading latency."
-            ),
-            "delegation_instructions": (
-                "Check payment-api ERROR logs for DB timeouts, check deployment history, "
-                "search runbooks for connection pool exhaustion."
-            ),
-        }),
-        usage=TokenUsage(input_tokens=500, output_tokens=200),
-        model="mock",
-        stop_reason="end_turn",
-    )
-
-
-def _research_response() -> Response:
-    return Response(
-        content=json.dumps({
-            "timeline": [
-                {"timestamp": "2024-01-15T14:00:00Z", "event": "Deployment a1bf3d2 applied"},
-                {"timestamp": "2024-01-15T14:25:00Z", "event": "First DB timeout errors"},
-                {"timestamp": "2024-01-15T14:30:00Z", "event": "Connection pool fully exhausted"},
-            ],
-            "root_cause": (
-                "Deployment a1bf3d2 by sarah.chen changed DB connection pool settings, "
-                "causing pool exhaustion 30 minutes after deploy."
-            ),
-            "confidence": 0.92,
-            "evidence": [
-                "DB connection pool at 98% capacity",
-                "Deploy a1bf3d2 changed pool settings at 14:00",
-                "ERROR logs show SQLSTATE 08006 timeout errors starting 14:25",
-            ],
-            "relevant_runbooks": [
-                "Database Connection Pool Exhaustion",
-                "Emergency Deployment Rollback",
-            ],
-            "affected_services": ["payment-api", "order-service"],
-        }),
-        usage=TokenUsage(input_tokens=2000, output_tokens=500),
-        model="mock",
-        stop_reason="end_turn",
-    )
-
-
-def _remediation_response() -> Response:
-    return Response(
-        content=json.dumps({
-            "remediation_steps": [
-                {
-                    "step": 1,
-                    "action": "Roll back deployment a1bf3d2 to previous revision",
-                    "risk": "high",
-                    "requires_approval": True,
-                    "rationale": "Deploy directly caused pool exhaustion",
-                    "runbook_reference": "Emergency Deployment Rollback",
-                },
-                {
-                    "step": 2,
-                    "action": "Monitor connection pool metrics for recovery",
-                    "risk": "low",
-                    "requires_approval": False,
-                    "rationale": "Verify pool utilization returns to normal",
-                },
-            ],
-            "requires_human_approval": True,
-            "summary": "Roll back the problematic deployment and monitor for recovery.",
-        }),
-        usage=TokenUsage(input_tokens=1000, output_tokens=300),
-        model="mock",
-        stop_reason="end_turn",
-    )
-
-
 def _tool_call_response(tool_name: str, tool_input: dict) -> Response:
     """Response that requests a tool call."""
     return Response(
@@ -126,8 +53,9 @@ def _tool_call_response(tool_name: str, tool_input: dict) -> Response:
 @pytest.mark.asyncio
 async def test_triage_agent_classifies_alert(
     sample_alert: Alert, tracer: DecisionTracer, tool_registry: ToolRegistry,
+    triage_response: Response,
 ):
-    mock = MockClient(responses=[_triage_response()])
+    mock = MockClient(responses=[triage_response])
     agent = TriageAgent(mock, tool_registry, tracer)
     trace_id = new_trace_id()
     tracer.start_trace(trace_id)
@@ -143,11 +71,12 @@ async def test_triage_agent_classifies_alert(
 @pytest.mark.asyncio
 async def test_triage_agent_with_tool_calls(
     sample_alert: Alert, tracer: DecisionTracer, tool_registry: ToolRegistry,
+    triage_response: Response,
 ):
     """Triage agent should handle tool call → result → final response loop."""
     mock = MockClient(responses=[
         _tool_call_response("get_metrics", {"service": "payment-api"}),
-        _triage_response(),  # Final response after seeing tool result
+        triage_response,  # Final response after seeing tool result
     ])
     agent = TriageAgent(mock, tool_registry, tracer)
     trace_id = new_trace_id()
@@ -193,9 +122,9 @@ async def test_triage_max_iterations_respected(
 
 @pytest.mark.asyncio
 async def test_research_agent_produces_findings(
-    tracer: DecisionTracer, tool_registry: ToolRegistry,
+    tracer: DecisionTracer, tool_registry: ToolRegistry, research_response: Response,
 ):
-    mock = MockClient(responses=[_research_response()])
+    mock = MockClient(responses=[research_response])
     agent = ResearchAgent(mock, tool_registry, tracer)
     trace_id = new_trace_id()
     tracer.start_trace(trace_id)
@@ -216,12 +145,14 @@ async def test_research_agent_produces_findings(
 
 
 @pytest.mark.asyncio
-async def test_research_agent_calls_tools(tracer: DecisionTracer, tool_registry: ToolRegistry):
+async def test_research_agent_calls_tools(
+    tracer: DecisionTracer, tool_registry: ToolRegistry, research_response: Response,
+):
     """Research agent should make tool calls and log them as trace steps."""
     mock = MockClient(responses=[
         _tool_call_response("search_logs", {"service": "payment-api", "severity": "ERROR"}),
         _tool_call_response("get_metrics", {"service": "payment-api"}),
-        _research_response(),
+        research_response,
     ])
     agent = ResearchAgent(mock, tool_registry, tracer)
     trace_id = new_trace_id()
@@ -246,14 +177,16 @@ async def test_research_agent_calls_tools(tracer: DecisionTracer, tool_registry:
 
 
 @pytest.mark.asyncio
-async def test_research_agent_max_tool_calls(tracer: DecisionTracer, tool_registry: ToolRegistry):
+async def test_research_agent_max_tool_calls(
+    tracer: DecisionTracer, tool_registry: ToolRegistry, research_response: Response,
+):
     """Research agent should stop after MAX_TOOL_CALLS (8) and request final analysis."""
     # 9 tool responses + 1 final response (forced after limit)
     responses = [
         _tool_call_response("get_metrics", {"service": "payment-api"})
         for _ in range(9)
     ]
-    responses.append(_research_response())
+    responses.append(research_response)
     mock = MockClient(responses=responses)
     agent = ResearchAgent(mock, tool_registry, tracer)
     trace_id = new_trace_id()
@@ -282,9 +215,9 @@ async def test_research_agent_max_tool_calls(tracer: DecisionTracer, tool_regist
 
 @pytest.mark.asyncio
 async def test_remediation_agent_requires_approval(
-    tracer: DecisionTracer, tool_registry: ToolRegistry,
+    tracer: DecisionTracer, tool_registry: ToolRegistry, remediation_response: Response,
 ):
-    mock = MockClient(responses=[_remediation_response()])
+    mock = MockClient(responses=[remediation_response])
     agent = RemediationAgent(mock, tool_registry, tracer)
     trace_id = new_trace_id()
     tracer.start_trace(trace_id)
@@ -339,12 +272,12 @@ async def test_remediation_forces_approval_when_missing(
 
 @pytest.mark.asyncio
 async def test_remediation_with_runbook_tool_call(
-    tracer: DecisionTracer, tool_registry: ToolRegistry,
+    tracer: DecisionTracer, tool_registry: ToolRegistry, remediation_response: Response,
 ):
     """Remediation agent should be able to search runbooks."""
     mock = MockClient(responses=[
         _tool_call_response("search_runbooks", {"query": "deployment rollback"}),
-        _remediation_response(),
+        remediation_response,
     ])
     agent = RemediationAgent(mock, tool_registry, tracer)
     trace_id = new_trace_id()
@@ -369,14 +302,8 @@ async def test_remediation_with_runbook_tool_call(
 
 
 @pytest.mark.asyncio
-async def test_orchestrator_full_pipeline(sample_alert: Alert):
-    mock = MockClient(responses=[
-        _triage_response(),
-        _research_response(),
-        _remediation_response(),
-    ])
-
-    analyzer = IncidentAnalyzer(llm_client=mock)
+async def test_orchestrator_full_pipeline(sample_alert: Alert, mock_llm_client: MockClient):
+    analyzer = IncidentAnalyzer(llm_client=mock_llm_client)
     report = await analyzer.analyze(sample_alert)
 
     assert report.incident_id.startswith("INC-")
@@ -389,10 +316,46 @@ async def test_orchestrator_full_pipeline(sample_alert: Alert):
 
 
 @pytest.mark.asyncio
-async def test_orchestrator_handles_agent_error_gracefully(sample_alert: Alert):
+async def test_orchestrator_reports_steps_as_they_happen(
+    sample_alert: Alert, mock_llm_client: MockClient,
+):
+    seen: list[str] = []
+    progress_at_triage: list[int] = []
+
+    def on_step(step) -> None:
+        seen.append(step.agent_name)
+        if step.agent_name == "triage":
+            # Called while the pipeline runs, before later agents have been asked
+            progress_at_triage.append(len(mock_llm_client.call_history))
+
+    analyzer = IncidentAnalyzer(llm_client=mock_llm_client)
+    report = await analyzer.analyze(sample_alert, on_step=on_step)
+
+    assert seen == [step.agent_name for step in report.agent_trace]
+    assert progress_at_triage and progress_at_triage[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_survives_failing_step_callback(
+    sample_alert: Alert, mock_llm_client: MockClient,
+):
+    def on_step(step) -> None:
+        raise RuntimeError("broken printer")
+
+    analyzer = IncidentAnalyzer(llm_client=mock_llm_client)
+    report = await analyzer.analyze(sample_alert, on_step=on_step)
+
+    assert report.confidence_score > 0.8
+    assert all(step.action != "error" for step in report.agent_trace)
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_handles_agent_error_gracefully(
+    sample_alert: Alert, triage_response: Response,
+):
     """If an agent raises an exception, the orchestrator catches it and still returns a report."""
     mock = MockClient(responses=[
-        _triage_response(),
+        triage_response,
     ])
     # After triage, no more responses → research will get a non-JSON mock response
     # which will cause a JSONDecodeError, but the fallback handler should catch it
@@ -411,8 +374,8 @@ async def test_orchestrator_timeout_handled(sample_alert: Alert):
 
     class SlowClient:
         async def chat(self, messages, tools=None):
-            await asyncio.sleep(999)
-            return _triage_response()
+            # Never resolves; unlike a long sleep there is no timer to cancel
+            return await asyncio.get_running_loop().create_future()
 
     analyzer = IncidentAnalyzer(llm_client=SlowClient())
 
@@ -427,14 +390,8 @@ async def test_orchestrator_timeout_handled(sample_alert: Alert):
 
 
 @pytest.mark.asyncio
-async def test_agent_trace_is_recorded(sample_alert: Alert):
-    mock = MockClient(responses=[
-        _triage_response(),
-        _research_response(),
-        _remediation_response(),
-    ])
-
-    analyzer = IncidentAnalyzer(llm_client=mock)
+async def test_agent_trace_is_recorded(sample_alert: Alert, mock_llm_client: MockClient):
+    analyzer = IncidentAnalyzer(llm_client=mock_llm_client)
     report = await analyzer.analyze(sample_alert)
 
     agent_names = [step.agent_name for step in report.agent_trace]
@@ -444,15 +401,9 @@ async def test_agent_trace_is_recorded(sample_alert: Alert):
 
 
 @pytest.mark.asyncio
-async def test_agent_messages_logged_to_trace(sample_alert: Alert):
+async def test_agent_messages_logged_to_trace(sample_alert: Alert, mock_llm_client: MockClient):
     """The orchestrator should record agent steps that include tokens and cost."""
-    mock = MockClient(responses=[
-        _triage_response(),
-        _research_response(),
-        _remediation_response(),
-    ])
-
-    analyzer = IncidentAnalyzer(llm_client=mock)
+    analyzer = IncidentAnalyzer(llm_client=mock_llm_client)
     report = await analyzer.analyze(sample_alert)
 
     # At least the final step from each agent should have tokens > 0
@@ -464,6 +415,91 @@ async def test_agent_messages_logged_to_trace(sample_alert: Alert):
         assert len(final_step) >= 1, f"{name} should have a step with tokens"
 
 
+# ---------------------------------------------------------------------------
+# LLM Client
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_anthropic_client_marks_system_prompt_cacheable():
+    from types import SimpleNamespace
+
+    captured: dict = {}
+
+    async def create(**kwargs):
+        captured.update(kwargs)
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text="ok")],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=2, cache_read_input_tokens=8),
+            stop_reason="end_turn",
+        )
+
+    client = AnthropicClient(api_key="test-key")
+    client._client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+    response = await client.chat([
+        {"role": "system", "content": "You are a triage agent."},
+        {"role": "user", "content": "alert"},
+    ])
+
+    assert response.content == "ok"
+    assert captured["system"] == [{
+        "type": "text",
+        "text": "You are a triage agent.",
+        "cache_control": {"type": "ephemeral"},
+    }]
+    assert captured["messages"] == [{"role": "user", "content": "alert"}]
+
+
+@pytest.mark.asyncio
+async def test_caching_client_replays_identical_requests_from_disk(
+    tmp_path, triage_response: Response,
+):
+    inner = MockClient(responses=[triage_response])
+    cache_path = tmp_path / "llm_cache.json"
+    messages = [{"role": "user", "content": "alert"}]
+
+    first = await CachingClient(inner, cache_path).chat(messages)
+    # A fresh wrapper reads the same file, as on a second demo run
+    second = await CachingClient(inner, cache_path).chat(messages)
+
+    assert len(inner.call_history) == 1
+    assert second == first
+
+
+@pytest.mark.asyncio
+async def test_caching_client_keys_entries_by_model(tmp_path, triage_response: Response):
+    cache_path = tmp_path / "llm_cache.json"
+    messages = [{"role": "user", "content": "alert"}]
+    client_a = MockClient(responses=[triage_response])
+    client_b = MockClient(responses=[triage_response])
+
+    await CachingClient(client_a, cache_path, model="model-a").chat(messages)
+    await CachingClient(client_b, cache_path, model="model-b").chat(messages)
+
+    assert len(client_a.call_history) == 1
+    assert len(client_b.call_history) == 1
+
+
+@pytest.mark.asyncio
+async def test_caching_client_does_not_cache_truncated_responses(tmp_path):
+    truncated = Response(
+        content="{\"classification\": \"resource-",
+        usage=TokenUsage(input_tokens=500, output_tokens=4096),
+        model="mock",
+        stop_reason="max_tokens",
+    )
+    inner = MockClient(responses=[truncated, truncated])
+    cache_path = tmp_path / "llm_cache.json"
+    messages = [{"role": "user", "content": "alert"}]
+
+    await CachingClient(inner, cache_path).chat(messages)
+    await CachingClient(inner, cache_path).chat(messages)
+
+    assert len(inner.call_history) == 2
+    assert not cache_path.exists()
+
+
 # ---------------------------------------------------------------------------
 # Message Bus
 # ---------------------------------------------------------------------------
@@ -496,6 +532,54 @@ async def test_message_bus_filters_by_agent():
     assert research_msgs[0].from_agent == "triage"
 
 
+@pytest.mark.asyncio
+async def test_message_bus_isolates_traces():
+    bus = MessageBus()
+    first, second = new_trace_id(), new_trace_id()
+
+    bus.send("triage", "research", "delegate", {}, first)
+    bus.send("triage", "research", "delegate", {}, second)
+    bus.send("research", "remediation", "delegate", {}, second)
+
+    assert len(bus.get_messages(first)) == 1
+    assert [m.to_agent for m in bus.get_messages(second)] == ["research", "remediation"]
+    assert len(bus.get_messages_for_agent("research", second)) == 1
+    assert bus.get_messages("trace-unknown") == []
+    assert bus.get_messages_for_agent("research", "trace-unknown") == []
+
+
+def test_message_bus_concurrent_senders():
+    bus = MessageBus()
+    trace_ids = [new_trace_id() for _ in range(4)]
+
+    def work(worker: int) -> None:
+        for i in range(100):
+            bus.send("triage", f"agent-{i % 2}", "delegate", {"i": i}, trace_ids[worker % 4])
+
+    threads = [threading.Thread(target=work, args=(w,)) for w in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for trace_id in trace_ids:
+        assert len(bus.get_messages(trace_id)) == 200
+        assert len(bus.get_messages_for_agent("agent-0", trace_id)) == 100
+
+
+def test_message_bus_evicts_least_recent_trace():
+    bus = MessageBus(max_traces=2)
+    bus.send("triage", "research", "delegate", {}, "t1")
+    bus.send("triage", "research", "delegate", {}, "t2")
+    bus.send("research", "remediation", "delegate", {}, "t1")
+    bus.send("triage", "research", "delegate", {}, "t3")
+
+    assert bus.get_messages("t2") == []
+    assert bus.get_messages_for_agent("research", "t2") == []
+    assert len(bus.get_messages("t1")) == 2
+    assert len(bus.get_messages("t3")) == 1
+
+
 # ---------------------------------------------------------------------------
 # Decision Tracer
 # ---------------------------------------------------------------------------
@@ -518,3 +602,23 @@ async def test_decision_tracer_exports_json():
     assert len(data) == 2
     assert data[0]["agent_name"] == "triage"
     assert tracer.get_total_tokens(trace_id) == 600
+    assert tracer.get_total_cost(trace_id) == pytest.approx(0.006)
+
+    # Restarting a trace resets its running totals
+    tracer.start_trace(trace_id)
+    assert tracer.get_total_tokens(trace_id) == 0
+    assert tracer.get_total_tokens("trace-unknown") == 0
+
+
+def test_decision_tracer_evicts_least_recent_trace():
+    tracer = DecisionTracer(max_traces=2)
+    tracer.start_trace("t1")
+    tracer.start_trace("t2")
+    tracer.log_step("t1", "triage", "classify", "r", tokens_used=10)
+    tracer.log_step("t3", "triage", "classify", "r", tokens_used=5)
+
+    assert tracer.get_trace("t2") == []
+    assert tracer.get_total_tokens("t2") == 0
+    assert tracer.get_total_tokens("t1") == 10
+    assert tracer.get_total_tokens("t3") == 5
+
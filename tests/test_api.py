@@ -178,6 +178,17 @@ def test_prometheus_metrics_endpoint(client: TestClient):
     assert "sentinel_" in response.text or "python_" in response.text
 
 
+def test_prometheus_metrics_multiprocess_mode(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch, tmp_path
+):
+    """With a multiprocess dir set, /metrics aggregates from the shared mmap files."""
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    # No worker has written to the empty dir, so nothing process-local leaks through
+    assert "sentinel_" not in response.text
+
+
 def test_prometheus_metrics_contain_sentinel_metrics(client: TestClient):
     """The metrics endpoint should expose our custom sentinel_ metrics."""
     response = client.get("/metrics")
@@ -192,6 +203,29 @@ def test_mcp_server_tools_defined():
     assert mcp.name == "Sentinel"
 
 
+def test_mcp_ensure_runbooks_checks_collection_once(monkeypatch):
+    from protocols import mcp_server
+
+    class _EmptyClient:
+        def __init__(self) -> None:
+            self.lookups = 0
+
+        def get_collection(self, name: str):
+            self.lookups += 1
+            raise ValueError("missing")
+
+    ingests: list[None] = []
+    monkeypatch.setattr(mcp_server, "ingest_runbooks", lambda: ingests.append(None))
+    monkeypatch.setattr(mcp_server, "_runbooks_ready", False)
+    client = _EmptyClient()
+
+    mcp_server._ensure_runbooks(client)
+    mcp_server._ensure_runbooks(client)
+
+    assert client.lookups == 1
+    assert len(ingests) == 1
+
+
 
 def test_record_tool_call():
     from monitoring.metrics import record_tool_call, sentinel_tool_calls_total
@@ -203,6 +237,16 @@ def test_record_tool_call():
     assert val >= 1
 
 
+def test_record_tool_call_caps_unknown_tool_names():
+    from monitoring.metrics import record_tool_call, sentinel_tool_calls_total
+
+    before = sentinel_tool_calls_total.labels(tool_name="other")._value.get()
+    record_tool_call("hallucinated_tool", 0.01)
+    after = sentinel_tool_calls_total.labels(tool_name="other")._value.get()
+    assert after == before + 1
+    assert ("hallucinated_tool",) not in sentinel_tool_calls_total._metrics
+
+
 def test_record_llm_call():
     from monitoring.metrics import record_llm_call, sentinel_llm_tokens_total
 
@@ -248,13 +292,22 @@ def test_record_rag_query_empty_scores():
 def test_record_analysis_complete(sample_report: IncidentReport):
     from monitoring.metrics import (
         record_analysis_complete,
+        sentinel_agent_steps_total,
         sentinel_human_approval_required_total,
         sentinel_incident_analyses_total,
     )
 
+    agents = [step.agent_name for step in sample_report.agent_trace]
+    before_steps = {
+        a: sentinel_agent_steps_total.labels(agent_name=a)._value.get() for a in set(agents)
+    }
     before_approval = sentinel_human_approval_required_total._value.get()
     record_analysis_complete(sample_report)
 
+    for agent_name, before in before_steps.items():
+        after = sentinel_agent_steps_total.labels(agent_name=agent_name)._value.get()
+        assert after == before + agents.count(agent_name)
+
     val = sentinel_incident_analyses_total.labels(severity="critical")._value.get()
     assert val >= 1
 
@@ -305,6 +358,34 @@ def test_tracer_export_includes_result():
     assert tc["result"] == {"cpu": 85}
 
 
+def test_tracer_export_handles_non_json_values():
+    """Non-string keys are coerced and unknown objects fall back to str()."""
+    from decimal import Decimal
+
+    from monitoring.tracer import DecisionTracer
+
+    tracer = DecisionTracer()
+    tracer.log_step(
+        trace_id="t4",
+        agent_name="research",
+        action="tool_call:get_metrics",
+        reasoning="check metrics",
+        tool_calls=[
+            ToolCall(
+                tool_name="get_metrics",
+                arguments={"service": "api"},
+                result={500: 3, "ratio": Decimal("0.25")},
+                latency_ms=50.0,
+                cost_usd=0.0,
+            )
+        ],
+    )
+
+    exported = tracer.export_trace_json("t4")
+    assert exported.startswith("[\n  {")
+    assert json.loads(exported)[0]["tool_calls"][0]["result"] == {"500": 3, "ratio": "0.25"}
+
+
 def test_tracer_export_for_dashboard():
     from monitoring.tracer import DecisionTracer
 
@@ -337,6 +418,10 @@ def test_tracer_export_for_dashboard():
     assert "research" in dashboard["agents"]
     assert dashboard["agents"]["research"]["tool_call_count"] == 2
     assert dashboard["agents"]["research"]["total_tokens"] == 2000
+    assert dashboard["total_cost"] == 0.006
+    assert dashboard["agents"]["triage"]["total_cost"] == 0.001
+    assert [s["agent_name"] for s in dashboard["steps"]] == ["triage", "research"]
+    assert dashboard["steps"] == json.loads(tracer.export_trace_json("t3"))
 
 
 
@@ -351,3 +436,36 @@ def test_configure_logging_json_mode(monkeypatch: pytest.MonkeyPatch):
     from monitoring.logging import configure_logging
 
     configure_logging()
+
+
+def test_configure_logging_reconfigures_only_on_change(monkeypatch: pytest.MonkeyPatch):
+    import structlog
+
+    from monitoring import logging as sentinel_logging
+
+    calls = []
+    monkeypatch.setattr(sentinel_logging, "_configured_for", None)
+    monkeypatch.setattr(structlog, "configure", lambda **kwargs: calls.append(kwargs))
+
+    monkeypatch.setenv("LOG_FORMAT", "json")
+    sentinel_logging.configure_logging()
+    sentinel_logging.configure_logging()
+    assert len(calls) == 1
+
+    monkeypatch.setenv("LOG_FORMAT", "console")
+    sentinel_logging.configure_logging()
+    assert len(calls) == 2
+
+
+def test_json_renderer_uses_orjson_and_returns_text():
+    import json
+    from datetime import UTC, datetime
+
+    from monitoring.logging import _JSON_RENDERER
+
+    line = _JSON_RENDERER(
+        None, "info", {"event": "x", "at": datetime(2024, 1, 1, tzinfo=UTC), "ids": {1: "a"}}
+    )
+    assert isinstance(line, str)
+    assert json.loads(line) == {"event": "x", "at": "2024-01-01T00:00:00+00:00", "ids": {"1": "a"}}
+
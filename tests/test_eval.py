@@ -4,12 +4,16 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
+import pytest
+
 from agent.models import Alert, IncidentReport
+from evaluation import matching
+from evaluation.matching import KeywordMatcher
 from evaluation.report import generate_report
 from evaluation.runner import EvalRun, ScenarioResult, run_scenario
-from evaluation.scenarios import load_all_scenarios
+from evaluation.scenarios import get_scenario, load_all_scenarios
 from evaluation.scenarios._base import EvalScenario
-from evaluation.scorer import score_scenario
+from evaluation.scorer import PARALLEL_MIN_PAIRS, score_all, score_many, score_scenario
 
 # ---------------------------------------------------------------------------
 # Scorer Tests
@@ -105,6 +109,109 @@ def test_scorer_empty_keywords():
     assert score.remediation_coverage == 1.0
 
 
+def test_scorer_services_overlapping_names():
+    """Services that overlap or prefix each other should all be credited when present."""
+    scenario = _make_scenario(expected_affected_services=["api", "api-gateway", "gateway"])
+    report = _make_report(root_cause="api-gateway rate limiter misconfigured")
+    score = score_scenario(scenario, report)
+
+    assert score.affected_services_accuracy == 1.0
+
+
+def test_scorer_cache_keys_on_scoring_inputs():
+    """Same-named scenarios with different expectations must not share cached scores."""
+    report = _make_report(confidence_score=0.45)
+    lenient = score_scenario(_make_scenario(min_confidence=0.45), report)
+    strict = score_scenario(_make_scenario(min_confidence=0.9), report)
+
+    assert lenient.confidence_calibration == 1.0
+    assert strict.confidence_calibration == 0.5
+    assert score_scenario(_make_scenario(min_confidence=0.9), report) is strict
+
+
+def test_scenarios_are_built_lazily_by_name():
+    subset = load_all_scenarios(["cpu_spike", "memory_leak"])
+    assert [s.name for s in subset] == ["cpu_spike", "memory_leak"]
+    assert get_scenario("cpu_spike") is subset[0]
+
+    with pytest.raises(KeyError):
+        get_scenario("no_such_scenario")
+
+
+def test_scorer_lowercases_length_changing_text():
+    """Text whose lowercase form changes length still scores each bucket correctly."""
+    scenario = _make_scenario(
+        expected_root_cause_keywords=["connection pool"],
+        expected_remediation_keywords=["increase pool size"],
+    )
+    report = _make_report(
+        root_cause="İstanbul region exhausted the connection pool",
+        remediation_steps=["Increase pool size"],
+    )
+    score = score_scenario(scenario, report)
+    assert score.root_cause_match == 1.0
+    assert score.remediation_coverage == 1.0
+
+
+def test_score_reflects_remediation_steps_changed_on_a_copy():
+    scenario = _make_scenario()
+    report = _make_report()
+    assert score_scenario(scenario, report).remediation_coverage == 1.0
+
+    edited = report.model_copy(update={"remediation_steps": ["do nothing"]})
+    assert score_scenario(scenario, edited).remediation_coverage == 0.0
+
+
+def test_score_all_matches_per_pair_scoring():
+    """Batch scoring should equal scoring each (report, scenario) pair individually."""
+    scenarios = [_make_scenario(), _make_scenario(name="other", min_confidence=0.95)]
+    reports = [_make_report(), _make_report(root_cause="Unknown", remediation_steps=[])]
+
+    scores = score_all(reports, scenarios)
+
+    expected = [score_scenario(s, r) for r in reports for s in scenarios]
+    assert scores == expected
+
+
+def test_score_many_parallel_matches_serial():
+    """Process-pool scoring should return the same scores, in order, as serial scoring."""
+    scenarios = load_all_scenarios()
+    report = _make_report()
+    pairs = [(scenarios[i % len(scenarios)], report) for i in range(PARALLEL_MIN_PAIRS)]
+
+    scores = score_many(pairs, max_workers=2)
+
+    assert scores == [score_scenario(s, r) for s, r in pairs]
+
+
+def test_keyword_matcher_matches_substring_semantics():
+    """Automaton and fallback scans should find the same (overlapping) keywords."""
+    matcher = KeywordMatcher(("scale", "scale up", "regex", "fix regex", "dns"))
+    text = "please scale up pods and fix regex backtracking"
+
+    assert matcher.found(text) == {"scale", "scale up", "regex", "fix regex"}
+    assert matcher.overlap(text) == 0.8
+
+    matcher._automaton = None
+    assert matcher.found(text) == {"scale", "scale up", "regex", "fix regex"}
+    assert matcher.found("dn") == set()
+    assert KeywordMatcher(()).overlap(text) == 1.0
+    # Duplicate keywords each count toward the denominator and the hits
+    assert KeywordMatcher(("dns", "dns", "scale")).overlap(text) == pytest.approx(1 / 3)
+
+
+def test_keyword_matcher_pyahocorasick_fallback(monkeypatch):
+    """Without ahocorasick_rs, the pyahocorasick automaton gives the same hits."""
+    pytest.importorskip("ahocorasick")
+    monkeypatch.setattr(matching, "_ahocorasick_rs", None)
+    matcher = KeywordMatcher(("scale", "scale up", "regex", "fix regex", "dns"))
+
+    assert matcher._automaton is not None
+    assert matcher.found("please scale up pods and fix regex") == {
+        "scale", "scale up", "regex", "fix regex",
+    }
+
+
 # ---------------------------------------------------------------------------
 # Scenario Loading Tests
 # ---------------------------------------------------------------------------
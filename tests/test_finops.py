@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime
 
+import numpy as np
+import pytest
+
 from monitoring.finops import (
     CLAUDE_SONNET_INPUT,
     CLAUDE_SONNET_OUTPUT,
     AnalysisCost,
     CostTracker,
     calculate_cost,
+    calculate_cost_batch,
 )
 
 # ---------------------------------------------------------------------------
@@ -36,6 +41,15 @@ def test_calculate_cost_zero_tokens():
     assert calculate_cost(0, 0) == 0.0
 
 
+def test_calculate_cost_batch_matches_scalar():
+    inputs = np.array([0, 500, 1_000_000])
+    outputs = np.array([0, 200, 1_000_000])
+    costs = calculate_cost_batch(inputs, outputs)
+    assert costs.tolist() == pytest.approx(
+        [calculate_cost(i, o) for i, o in zip(inputs.tolist(), outputs.tolist())]
+    )
+
+
 # ---------------------------------------------------------------------------
 # CostTracker — record_analysis
 # ---------------------------------------------------------------------------
@@ -78,6 +92,44 @@ def test_record_analysis_same_agent_twice():
     assert abs(cost["by_agent"]["triage"] - round(expected_triage, 6)) < 1e-10
 
 
+def test_bulk_record_matches_record_analysis():
+    rows = [
+        ("INC-001", "triage", 500, 200),
+        ("INC-002", "triage", 1000, 400),
+        ("INC-001", "research", 2000, 500),
+        ("INC-001", "triage", 300, 100),
+    ]
+    one_by_one = CostTracker()
+    for row in rows:
+        one_by_one.record_analysis(*row)
+    bulk = CostTracker()
+    bulk.bulk_record(rows)
+
+    for incident_id in ("INC-001", "INC-002"):
+        assert bulk.get_analysis_cost(incident_id) == one_by_one.get_analysis_cost(incident_id)
+    assert list(bulk._analyses) == ["INC-001", "INC-002"]
+    assert bulk._analyses["INC-001"].total_input_tokens == 2800
+    assert bulk.get_cost_summary() == one_by_one.get_cost_summary()
+
+
+def test_record_analysis_concurrent_threads():
+    tracker = CostTracker()
+
+    def work(worker: int) -> None:
+        for i in range(200):
+            tracker.record_analysis(f"INC-{worker}-{i % 20}", "triage", 100, 10)
+
+    threads = [threading.Thread(target=work, args=(w,)) for w in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    summary = tracker.get_cost_summary()
+    assert summary["total_analyses"] == 160
+    assert summary["total_cost"] == round(8 * 200 * calculate_cost(100, 10), 6)
+
+
 def test_record_tool_calls():
     tracker = CostTracker()
     tracker.record_analysis("INC-001", "triage", 500, 200)
@@ -163,6 +215,58 @@ def test_get_cost_summary_respects_time_window():
     assert summary_0h["total_analyses"] == 0
 
 
+def test_get_cost_summary_excludes_old_analyses():
+    tracker = CostTracker()
+    tracker.record_analysis("INC-OLD", "triage", 500, 200)
+    tracker.record_analysis("INC-NEW", "triage", 500, 200)
+    tracker._analyses["INC-OLD"].created_at -= 25 * 3600
+
+    summary = tracker.get_cost_summary(last_n_hours=24)
+    assert summary["total_analyses"] == 1
+    assert summary["most_expensive_analysis"]["incident_id"] == "INC-NEW"
+
+
+def test_get_cost_summary_tracks_growing_costs():
+    """The running aggregates follow analyses whose cost grows after creation."""
+    tracker = CostTracker()
+    for i in range(50):
+        tracker.record_analysis(f"INC-{i:03d}", "triage", 500, 200)
+    tracker.record_analysis("INC-007", "research", 50_000, 10_000)
+
+    summary = tracker.get_cost_summary()
+    expected_total = sum(
+        tracker.get_analysis_cost(f"INC-{i:03d}")["total"] for i in range(50)
+    )
+    assert summary["total_analyses"] == 50
+    assert summary["total_cost"] == round(expected_total, 6)
+    assert summary["most_expensive_analysis"]["incident_id"] == "INC-007"
+    assert len(tracker._top) <= 2 * 50 + 16
+
+
+def test_cost_tracker_evicts_oldest_beyond_max_entries():
+    tracker = CostTracker(max_entries=3)
+    for i in range(5):
+        tracker.record_analysis(f"INC-{i}", "triage", 500, 200)
+
+    assert tracker.get_analysis_cost("INC-0")["total"] == 0.0
+    assert tracker.get_analysis_cost("INC-1")["total"] == 0.0
+    summary = tracker.get_cost_summary()
+    assert summary["total_analyses"] == 3
+    assert summary["total_cost"] == round(3 * calculate_cost(500, 200), 6)
+
+
+def test_cost_tracker_evicts_expired_analyses():
+    tracker = CostTracker(ttl_hours=48)
+    tracker.record_analysis("INC-OLD", "research", 50_000, 10_000)
+    tracker._analyses["INC-OLD"].created_at -= 49 * 3600
+    tracker.record_analysis("INC-NEW", "triage", 500, 200)
+
+    assert tracker.get_analysis_cost("INC-OLD")["total"] == 0.0
+    summary = tracker.get_cost_summary(last_n_hours=72)
+    assert summary["total_analyses"] == 1
+    assert summary["most_expensive_analysis"]["incident_id"] == "INC-NEW"
+
+
 # ---------------------------------------------------------------------------
 # AnalysisCost dataclass
 # ---------------------------------------------------------------------------
@@ -7,7 +7,8 @@ from pathlib import Path
 
 import pytest
 
-from rag.engine import RAGEngine
+from rag.embeddings import EmbeddingModel
+from rag.engine import RAGEngine, _classify_confidences
 from rag.ingest import _chunk_text, _extract_title, ingest_runbooks
 
 
@@ -79,6 +80,13 @@ def test_extract_title():
     assert _extract_title("No heading here") == "Untitled"
 
 
+def test_classify_confidences_boundaries():
+    import numpy as np
+
+    scores = np.array([0.0, 0.39, 0.4, 0.7, 0.71, 1.0])
+    assert _classify_confidences(scores) == ["low", "low", "medium", "medium", "high", "high"]
+
+
 def test_chunk_text_creates_overlapping_chunks():
     text = "A" * 1024
     chunks = _chunk_text(text, chunk_size=512, overlap=50)
@@ -141,3 +149,33 @@ async def test_empty_collection_returns_no_results(chroma_dir: Path):
     engine = RAGEngine(chroma_persist_dir=str(chroma_dir))
     results = await engine.search("anything")
     assert results == []
+
+
+class _CountingEncoder:
+    """Stands in for SentenceTransformer so batching is testable without the model."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def encode(self, texts: list[str], **kwargs):
+        import numpy as np
+
+        self.batches.append(list(texts))
+        return np.array([[float(len(t)), 1.0] for t in texts], dtype=np.float32)
+
+
+@pytest.mark.asyncio
+async def test_embed_one_coalesces_concurrent_queries():
+    import asyncio
+    import weakref
+
+    model = object.__new__(EmbeddingModel)
+    model._model = _CountingEncoder()
+    model._pending = weakref.WeakKeyDictionary()
+    model._flushes = set()
+
+    vectors = await asyncio.gather(*(model.embed_one("q" * n) for n in range(1, 6)))
+
+    assert model._model.batches == [["q", "qq", "qqq", "qqqq", "qqqqq"]]
+    assert [v[0] for v in vectors] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
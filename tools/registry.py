@@ -3,17 +3,19 @@
 from __future__ import annotations
 
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
 from agent.models import ToolCall
-from rag.engine import RAGEngine
 from tools.dependencies import get_service_dependencies
 from tools.deployments import get_recent_deployments
 from tools.log_search import search_logs
 from tools.metrics import get_metrics
 
+if TYPE_CHECKING:
+    from rag.engine import RAGEngine
+
 logger = structlog.get_logger()
 
 # Tool schemas for LLM tool-use (Claude API format)